@@ -6,33 +6,405 @@ and identify potential data quality issues for downstream modeling/labeling.
 """
 
 import json
+import math
 import re
+from bisect import bisect_left
 from collections import Counter
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-import statistics
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+
+from src.utils.json_stream import iter_json_array
+
+
+# Fields checked by the missing-values section, in report order.
+REVIEW_FIELDS = (
+    'review_id', 'app_id', 'author', 'rating', 'content',
+    'timestamp', 'thumbs_up', 'app_version', 'reply_content',
+    'reply_timestamp', 'scraped_at'
+)
+
+LENGTH_BUCKETS = (
+    'empty', 'very_short_1_10', 'short_11_50', 'medium_51_200', 'long_200+'
+)
+
+
+# Text patterns, compiled once at import rather than per review
+_RE_REPEATED = re.compile(r'(.)\1{4,}')
+_RE_LATIN = re.compile(r'[a-zA-Z]')
+
+# Script detection, highest priority first. A review counts toward the
+# first script it contains any character of.
+SCRIPT_RANGES = (
+    ('cyrillic', ((0x0410, 0x044F), (0x0401, 0x0401), (0x0451, 0x0451))),
+    ('arabic', ((0x0600, 0x06FF),)),
+    ('devanagari', ((0x0900, 0x097F),)),
+    ('cjk', ((0x4E00, 0x9FFF), (0x3400, 0x4DBF))),
+    ('latin', ((0x41, 0x5A), (0x61, 0x7A))),
+)
+
+
+def _build_script_table() -> str:
+    """
+    Build a str.translate table mapping each BMP codepoint to a script tag.
+
+    The tag for SCRIPT_RANGES[i] is str(i + 1); every other BMP codepoint
+    (digits included) maps to NUL. Astral characters fall outside the
+    table and pass through translate unchanged, so they never collide
+    with a tag.
+    """
+    table = ['\0'] * 0x10000
+    for i, (_, ranges) in enumerate(SCRIPT_RANGES):
+        tag = str(i + 1)
+        for lo, hi in ranges:
+            table[lo:hi + 1] = tag * (hi - lo + 1)
+    return ''.join(table)
+
+
+_SCRIPT_TABLE = _build_script_table()
+_SCRIPT_TAGS = tuple(
+    (str(i + 1), name) for i, (name, _) in enumerate(SCRIPT_RANGES)
+)
+
+WEEKDAY_NAMES = (
+    'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'
+)
+
+# Upper bound (inclusive) of each LENGTH_BUCKETS entry except the last;
+# bisect_left on a stripped length yields the bucket index directly.
+LENGTH_BUCKET_BOUNDS = (0, 10, 50, 200)
+
+
+def _median_from_counts(counts: Dict[Any, int]) -> Any:
+    """
+    Median of a dataset given as {value: occurrences}.
+
+    Matches statistics.median (mean of the two middle values for an even
+    count) without expanding the values into a sorted list.
+    """
+    n = sum(counts.values())
+    if not n:
+        return 0
+    lo_idx, hi_idx = (n - 1) // 2, n // 2
+    seen = 0
+    lo = None
+    for value in sorted(counts):
+        seen += counts[value]
+        if lo is None and seen > lo_idx:
+            lo = value
+        if seen > hi_idx:
+            return lo if lo_idx == hi_idx else (lo + value) / 2
+    return lo
+
+
+@dataclass
+class _ScanAccumulators:
+    """Everything the analyzer sections read, built by one scan of the data."""
+    total: int = 0
+    fields: List[str] = field(default_factory=list)
+    missing_null: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(REVIEW_FIELDS, 0))
+    missing_empty: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(REVIEW_FIELDS, 0))
+    rating_counter: Counter = field(default_factory=Counter)
+    rating_sum: float = 0
+    rating_sumsq: float = 0
+    app_counter: Counter = field(default_factory=Counter)
+    authors: set = field(default_factory=set)
+    id_fingerprint: Dict[Any, int] = field(default_factory=dict)
+    repeated_ids: List[Tuple[Any, int]] = field(default_factory=list)
+    content_counter: Counter = field(default_factory=Counter)
+    content_text: Dict[int, Optional[str]] = field(default_factory=dict)
+    content_features: Dict[int, Tuple] = field(default_factory=dict)
+    reply_count: int = 0
+    replied_rating_counter: Counter = field(default_factory=Counter)
+    day_counter: Counter = field(default_factory=Counter)
+    ts_min: Optional[datetime] = None
+    ts_max: Optional[datetime] = None
+    ts_parse_errors: int = 0
+
+
+@dataclass
+class _TextProfile:
+    """Per-text checks weighted by review count; see _profile_texts()."""
+    n_contents: int
+    length_buckets: List[int]
+    length_counts: Counter
+    word_counts: List[int]
+    length_sum: int
+    word_sum: int
+    single_word: int
+    repeated_chars: int
+    all_caps: int
+    emoji_only: int
+    non_ascii: int
+    encoding_errors: int
+    html_entities: int
+    scripts: Dict[str, int]
+
+
+def _scan_rows(rows: Iterable[Dict[str, Any]]) -> _ScanAccumulators:
+    """
+    Walk a sequence of reviews once and build every accumulator the
+    analyzer sections need.
+    """
+    total = 0
+    fields: List[str] = []
+    missing_null = dict.fromkeys(REVIEW_FIELDS, 0)
+    missing_empty = dict.fromkeys(REVIEW_FIELDS, 0)
+    rating_counter = Counter()
+    rating_sum = 0
+    rating_sumsq = 0
+    reply_count = 0
+    replied_rating_counter = Counter()
+    # Low-cardinality keys are dictionary-encoded: each distinct key gets a
+    # dense code on first sight and counts live in a list indexed by code,
+    # which is much cheaper per row than a Counter update.
+    app_codes: Dict[Any, int] = {}
+    app_counts: List[int] = []
+    authors = set()
+    # First content fingerprint per review ID; later rows reusing an ID are
+    # the only candidates for duplicates, so just those are kept aside.
+    id_fingerprint: Dict[Any, int] = {}
+    repeated_ids: List[Tuple[Any, int]] = []
+    # Content is counted by fingerprint rather than by the strings
+    # themselves. The first time a text is seen, its per-text checks run and
+    # the results are kept alongside the text (for the duplicate report);
+    # every later copy is a single count increment.
+    content_counter: Dict[int, int] = {}
+    content_text: Dict[int, Optional[str]] = {}
+    content_features: Dict[int, Tuple] = {}
+
+    # Timestamps are parsed once and bucketed by calendar day; month and
+    # weekday distributions are derived from the distinct days later.
+    day_codes: Dict[int, int] = {}
+    day_counts: List[int] = []
+    ts_min = ts_max = None
+    ts_parse_errors = 0
+
+    # Local aliases: the loop body runs once per review, so avoid repeated
+    # global and attribute lookups.
+    fromisoformat = datetime.fromisoformat
+    review_fields = REVIEW_FIELDS
+    add_author = authors.add
+    add_repeated_id = repeated_ids.append
+    text_features = _text_features
+    _hash = hash
+    _isinstance = isinstance
+
+    for r in rows:
+        if not total:
+            fields = list(r.keys())
+        total += 1
+        get = r.get
+
+        for field in review_fields:
+            v = get(field)
+            if v is None:
+                missing_null[field] += 1
+            elif v == '':
+                missing_empty[field] += 1
+
+        rating = get('rating')
+        if rating is not None:
+            rating_counter[rating] += 1
+            rating_sum += rating
+            rating_sumsq += rating * rating
+        if get('reply_content'):
+            reply_count += 1
+            replied_rating_counter[rating] += 1
+
+        raw_content = get('content', '')
+        fingerprint = _hash(raw_content)
+        seen = content_counter.get(fingerprint)
+        if seen is None:
+            content_counter[fingerprint] = 1
+            content_text[fingerprint] = raw_content
+            content_features[fingerprint] = text_features(raw_content or '')
+        else:
+            content_counter[fingerprint] = seen + 1
+
+        review_id = get('review_id', '')
+        if review_id in id_fingerprint:
+            add_repeated_id((review_id, fingerprint))
+        else:
+            id_fingerprint[review_id] = fingerprint
+
+        app_id = get('app_id', 'unknown')
+        code = app_codes.get(app_id)
+        if code is None:
+            code = app_codes[app_id] = len(app_counts)
+            app_counts.append(0)
+        app_counts[code] += 1
+        add_author(get('author', ''))
+
+        ts = get('timestamp')
+        if ts:
+            try:
+                dt = fromisoformat(ts.replace('Z', '+00:00')) if _isinstance(ts, str) else ts
+            except (ValueError, TypeError):
+                ts_parse_errors += 1
+            else:
+                day = dt.toordinal()
+                code = day_codes.get(day)
+                if code is None:
+                    code = day_codes[day] = len(day_counts)
+                    day_counts.append(0)
+                day_counts[code] += 1
+                if ts_min is None:
+                    ts_min = ts_max = dt
+                elif dt < ts_min:
+                    ts_min = dt
+                elif dt > ts_max:
+                    ts_max = dt
+
+    return _ScanAccumulators(
+        total=total,
+        fields=fields,
+        missing_null=missing_null,
+        missing_empty=missing_empty,
+        rating_counter=rating_counter,
+        rating_sum=rating_sum,
+        rating_sumsq=rating_sumsq,
+        app_counter=Counter(dict(zip(app_codes, app_counts))),
+        authors=authors,
+        id_fingerprint=id_fingerprint,
+        repeated_ids=repeated_ids,
+        content_counter=Counter(content_counter),
+        content_text=content_text,
+        content_features=content_features,
+        reply_count=reply_count,
+        replied_rating_counter=replied_rating_counter,
+        day_counter=Counter(dict(zip(day_codes, day_counts))),
+        ts_min=ts_min,
+        ts_max=ts_max,
+        ts_parse_errors=ts_parse_errors,
+    )
+
+
+def _text_features(c: str) -> Tuple:
+    """
+    Run every per-text check on one distinct review text.
+
+    Returns (length bucket index, length, word count, repeated chars,
+    all caps, emoji only, replacement char, HTML entity, non-ASCII,
+    script name or None for empty text). ASCII texts skip the
+    script-table translate: they can only be latin or other, which the
+    latin search already decides.
+    """
+    length = len(c)
+    bucket = bisect_left(LENGTH_BUCKET_BOUNDS, len(c.strip()))
+    words = len(c.split())
+    # Repeated characters (spam indicator); a run needs five characters
+    repeated = length >= 5 and _RE_REPEATED.search(c) is not None
+    # All caps reviews; the length test is cheaper, so it goes first
+    all_caps = length > 5 and c.isupper()
+    if not c:
+        return (bucket, 0, 0, False, False, False, False, False, False, None)
+
+    # Reviews with only emojis/special chars
+    has_latin = _RE_LATIN.search(c) is not None
+    # Encoding issues and undecoded HTML entities
+    replacement = '\ufffd' in c
+    html = '&amp;' in c or '&lt;' in c or '&#' in c
+
+    # Primary script: one C-level translate, then a substring test per script
+    if c.isascii():
+        return (bucket, length, words, repeated, all_caps, not has_latin,
+                replacement, html, False, 'latin' if has_latin else 'other')
+    tags = c.translate(_SCRIPT_TABLE)
+    for tag, name in _SCRIPT_TAGS:
+        if tag in tags:
+            script = name
+            break
+    else:
+        script = 'other'
+    return (bucket, length, words, repeated, all_caps, not has_latin,
+            replacement, html, True, script)
+
+
+def _profile_texts(content_counter: Counter, content_features: Dict[int, Tuple]) -> _TextProfile:
+    """
+    Weight the per-text checks from the scan by how many reviews share
+    each text.
+    """
+    length_buckets = [0] * len(LENGTH_BUCKETS)
+    length_counts = Counter()
+    word_counts = []
+    length_sum = 0
+    word_sum = 0
+    single_word = 0
+    repeated_chars = 0
+    all_caps = 0
+    emoji_only = 0
+    non_ascii = 0
+    encoding_errors = 0
+    html_entities = 0
+    scripts = dict.fromkeys(('latin', 'cyrillic', 'arabic', 'devanagari', 'cjk', 'other'), 0)
+
+    for fingerprint, n in content_counter.items():
+        (bucket, length, words, repeated, caps, emoji,
+         replacement, html, wide, script) = content_features[fingerprint]
+        length_buckets[bucket] += n
+        length_counts[length] += n
+        word_counts.append(words)
+        length_sum += length * n
+        word_sum += words * n
+        if words == 1:
+            single_word += n
+        if repeated:
+            repeated_chars += n
+        if caps:
+            all_caps += n
+        if emoji:
+            emoji_only += n
+        if replacement:
+            encoding_errors += n
+        if html:
+            html_entities += n
+        if wide:
+            non_ascii += n
+        if script is not None:
+            scripts[script] += n
+
+    return _TextProfile(
+        n_contents=sum(content_counter.values()),
+        length_buckets=length_buckets,
+        length_counts=length_counts,
+        word_counts=word_counts,
+        length_sum=length_sum,
+        word_sum=word_sum,
+        single_word=single_word,
+        repeated_chars=repeated_chars,
+        all_caps=all_caps,
+        emoji_only=emoji_only,
+        non_ascii=non_ascii,
+        encoding_errors=encoding_errors,
+        html_entities=html_entities,
+        scripts=scripts,
+    )
 
 
 class DataQualityAnalyzer:
     """Analyzer for Google Play review data quality."""
 
-    def __init__(self, data: List[Dict[str, Any]]):
+    def __init__(self, data: Iterable[Dict[str, Any]]):
         """
         Initialize analyzer with review data.
 
+        The data is consumed by a single scan at construction time, so any
+        iterable works, including a stream from iter_json_array().
+
         Args:
-            data: List of review dictionaries
+            data: Iterable of review dictionaries
         """
         self.data = data
-        self.total_reviews = len(data)
+        self._acc: _ScanAccumulators = self._scan_once()
+        self.total_reviews = self._acc.total
 
     @classmethod
     def from_json_file(cls, filepath: Path) -> 'DataQualityAnalyzer':
-        """Load data from JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return cls(data)
+        """Load data from JSON file, streaming reviews into the scan."""
+        return cls(iter_json_array(filepath))
 
     def run_full_analysis(self) -> Dict[str, Any]:
         """Run complete data quality analysis."""
@@ -56,20 +428,44 @@ class DataQualityAnalyzer:
         self.print_summary(results)
         return results
 
+    def _scan_once(self) -> _ScanAccumulators:
+        """
+        Walk the dataset once and build every accumulator the sections need.
+
+        Each analyze_* method formats results from these accumulators
+        instead of re-iterating self.data. The scan runs once, from
+        __init__, and the result is cached for the analyzer's lifetime.
+        """
+        acc = getattr(self, '_acc', None)
+        if acc is not None:
+            return acc
+
+        self._acc = _scan_rows(self.data)
+        return self._acc
+
+    def _text_profile(self) -> _TextProfile:
+        """Per-text checks shared by the text-quality and language sections."""
+        profile = getattr(self, '_profile', None)
+        if profile is None:
+            acc = self._scan_once()
+            profile = self._profile = _profile_texts(
+                acc.content_counter, acc.content_features
+            )
+        return profile
+
     def analyze_overview(self) -> Dict[str, Any]:
         """Basic dataset overview."""
         print("\n" + "-" * 70)
         print("1. DATASET OVERVIEW")
         print("-" * 70)
 
-        apps = set(r.get('app_id', '') for r in self.data)
-        authors = set(r.get('author', '') for r in self.data)
+        acc = self._scan_once()
 
         overview = {
             'total_reviews': self.total_reviews,
-            'unique_apps': len(apps),
-            'unique_authors': len(authors),
-            'fields_per_review': list(self.data[0].keys()) if self.data else [],
+            'unique_apps': len(acc.app_counter),
+            'unique_authors': len(acc.authors),
+            'fields_per_review': acc.fields,
         }
 
         print(f"Total reviews: {overview['total_reviews']:,}")
@@ -86,16 +482,12 @@ class DataQualityAnalyzer:
         print("2. MISSING VALUES ANALYSIS")
         print("-" * 70)
 
-        fields = [
-            'review_id', 'app_id', 'author', 'rating', 'content',
-            'timestamp', 'thumbs_up', 'app_version', 'reply_content',
-            'reply_timestamp', 'scraped_at'
-        ]
+        acc = self._scan_once()
 
         missing = {}
-        for field in fields:
-            null_count = sum(1 for r in self.data if r.get(field) is None)
-            empty_count = sum(1 for r in self.data if r.get(field) == '')
+        for field in REVIEW_FIELDS:
+            null_count = acc.missing_null[field]
+            empty_count = acc.missing_empty[field]
             total_missing = null_count + empty_count
             pct = (total_missing / self.total_reviews * 100) if self.total_reviews > 0 else 0
             missing[field] = {
@@ -120,29 +512,36 @@ class DataQualityAnalyzer:
         print("3. RATING DISTRIBUTION")
         print("-" * 70)
 
-        ratings = [r.get('rating', 0) for r in self.data if r.get('rating') is not None]
+        acc = self._scan_once()
+        distribution = acc.rating_counter
+        total = sum(distribution.values())
 
-        if not ratings:
+        if not total:
             print("No rating data available")
             return {}
 
-        distribution = Counter(ratings)
-        total = len(ratings)
-
-        # Calculate statistics
-        mean_rating = statistics.mean(ratings)
-        median_rating = statistics.median(ratings)
-        stdev_rating = statistics.stdev(ratings) if len(ratings) > 1 else 0
+        # Mean and sample stdev from the running sum / sum of squares
+        rating_sum = acc.rating_sum
+        mean_rating = rating_sum / total
+        if total > 1:
+            variance = (
+                (total * acc.rating_sumsq - rating_sum * rating_sum)
+                / (total * (total - 1))
+            )
+            stdev_rating = math.sqrt(max(variance, 0))
+        else:
+            stdev_rating = 0
+        median_rating = _median_from_counts(distribution)
 
         # Check for invalid ratings
-        invalid_ratings = [r for r in ratings if r < 1 or r > 5]
+        invalid_count = sum(c for r, c in distribution.items() if r < 1 or r > 5)
 
         result = {
             'distribution': dict(distribution),
             'mean': round(mean_rating, 2),
             'median': median_rating,
             'stdev': round(stdev_rating, 2),
-            'invalid_count': len(invalid_ratings),
+            'invalid_count': invalid_count,
         }
 
         print(f"\nMean rating: {result['mean']:.2f}")
@@ -173,56 +572,29 @@ class DataQualityAnalyzer:
         print("4. TEXT CONTENT QUALITY")
         print("-" * 70)
 
-        contents = [r.get('content', '') or '' for r in self.data]
-
-        # Length analysis
-        lengths = [len(c) for c in contents]
-        word_counts = [len(c.split()) for c in contents]
-
-        # Empty/very short reviews
-        empty_reviews = sum(1 for c in contents if len(c.strip()) == 0)
-        very_short = sum(1 for c in contents if 0 < len(c.strip()) <= 10)
-        short = sum(1 for c in contents if 10 < len(c.strip()) <= 50)
-        medium = sum(1 for c in contents if 50 < len(c.strip()) <= 200)
-        long_reviews = sum(1 for c in contents if len(c.strip()) > 200)
-
-        # Single word reviews
-        single_word = sum(1 for c in contents if len(c.split()) == 1)
-
-        # Repeated characters (spam indicator)
-        repeated_pattern = re.compile(r'(.)\1{4,}')
-        repeated_char_reviews = sum(1 for c in contents if repeated_pattern.search(c))
-
-        # All caps reviews
-        all_caps = sum(1 for c in contents if c.isupper() and len(c) > 5)
-
-        # Reviews with only emojis/special chars
-        emoji_only = sum(1 for c in contents if c and not re.search(r'[a-zA-Z]', c))
+        profile = self._text_profile()
+        length_counts = profile.length_counts
+        word_counts = profile.word_counts
+        n_contents = profile.n_contents
 
         result = {
             'char_length': {
-                'min': min(lengths) if lengths else 0,
-                'max': max(lengths) if lengths else 0,
-                'mean': round(statistics.mean(lengths), 1) if lengths else 0,
-                'median': statistics.median(lengths) if lengths else 0,
+                'min': min(length_counts) if length_counts else 0,
+                'max': max(length_counts) if length_counts else 0,
+                'mean': round(profile.length_sum / n_contents, 1) if n_contents else 0,
+                'median': _median_from_counts(length_counts),
             },
             'word_count': {
                 'min': min(word_counts) if word_counts else 0,
                 'max': max(word_counts) if word_counts else 0,
-                'mean': round(statistics.mean(word_counts), 1) if word_counts else 0,
-            },
-            'length_distribution': {
-                'empty': empty_reviews,
-                'very_short_1_10': very_short,
-                'short_11_50': short,
-                'medium_51_200': medium,
-                'long_200+': long_reviews,
+                'mean': round(profile.word_sum / n_contents, 1) if n_contents else 0,
             },
+            'length_distribution': dict(zip(LENGTH_BUCKETS, profile.length_buckets)),
             'quality_flags': {
-                'single_word': single_word,
-                'repeated_chars': repeated_char_reviews,
-                'all_caps': all_caps,
-                'emoji_only': emoji_only,
+                'single_word': profile.single_word,
+                'repeated_chars': profile.repeated_chars,
+                'all_caps': profile.all_caps,
+                'emoji_only': profile.emoji_only,
             }
         }
 
@@ -256,35 +628,30 @@ class DataQualityAnalyzer:
         print("5. TEMPORAL ANALYSIS")
         print("-" * 70)
 
-        timestamps = []
-        parse_errors = 0
-
-        for r in self.data:
-            ts = r.get('timestamp')
-            if ts:
-                try:
-                    if isinstance(ts, str):
-                        dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                    else:
-                        dt = ts
-                    timestamps.append(dt)
-                except (ValueError, TypeError):
-                    parse_errors += 1
-
-        if not timestamps:
+        acc = self._scan_once()
+        parse_errors = acc.ts_parse_errors
+
+        if not acc.day_counter:
             print("No valid timestamps found")
             return {'parse_errors': parse_errors}
 
         # Date range
-        min_date = min(timestamps)
-        max_date = max(timestamps)
+        min_date = acc.ts_min
+        max_date = acc.ts_max
         date_range_days = (max_date - min_date).days
 
-        # Distribution by month
-        month_dist = Counter(dt.strftime('%Y-%m') for dt in timestamps)
-
-        # Distribution by day of week
-        dow_dist = Counter(dt.strftime('%A') for dt in timestamps)
+        # Distribution by month and day of week from the distinct days:
+        # months are keyed by integer (year, month) and only formatted once
+        # each; proleptic ordinal 1 is a Monday, so weekday = (ordinal - 1) % 7
+        month_counts = Counter()
+        dow_dist = Counter()
+        for ordinal, count in acc.day_counter.items():
+            day = date.fromordinal(ordinal)
+            month_counts[(day.year, day.month)] += count
+            dow_dist[WEEKDAY_NAMES[(ordinal - 1) % 7]] += count
+        month_dist = Counter({
+            f"{year}-{month:02d}": count for (year, month), count in month_counts.items()
+        })
 
         result = {
             'date_range': {
@@ -316,7 +683,7 @@ class DataQualityAnalyzer:
         print("6. APP DISTRIBUTION")
         print("-" * 70)
 
-        app_counts = Counter(r.get('app_id', 'unknown') for r in self.data)
+        app_counts = self._scan_once().app_counter
 
         result = {
             'total_apps': len(app_counts),
@@ -348,28 +715,29 @@ class DataQualityAnalyzer:
         print("7. DUPLICATE ANALYSIS")
         print("-" * 70)
 
-        # Duplicate review IDs
-        review_ids = [r.get('review_id', '') for r in self.data]
-        id_counts = Counter(review_ids)
-        duplicate_ids = {k: v for k, v in id_counts.items() if v > 1}
+        acc = self._scan_once()
+
+        # Duplicate review IDs: only rows that reused an ID need counting
+        id_fingerprint = acc.id_fingerprint
+        repeated_ids = acc.repeated_ids
+        duplicate_ids = {review_id for review_id, _ in repeated_ids}
 
-        # Duplicate content
-        contents = [r.get('content', '') for r in self.data]
-        content_counts = Counter(contents)
-        duplicate_content = {k: v for k, v in content_counts.items() if v > 1 and k}
+        # Duplicate content, keyed by fingerprint
+        content_counts = acc.content_counter
+        text = acc.content_text
+        duplicate_content = {k: v for k, v in content_counts.items() if v > 1 and text[k]}
+        top_content = [(text[k], v) for k, v in content_counts.most_common(5)]
 
         # Exact duplicate reviews (same ID and content)
-        review_hashes = Counter(
-            (r.get('review_id', ''), r.get('content', ''))
-            for r in self.data
-        )
-        exact_duplicates = sum(1 for v in review_hashes.values() if v > 1)
+        pair_counts = Counter(repeated_ids)
+        pair_counts.update((review_id, id_fingerprint[review_id]) for review_id in duplicate_ids)
+        exact_duplicates = sum(1 for v in pair_counts.values() if v > 1)
 
         result = {
             'duplicate_review_ids': len(duplicate_ids),
             'duplicate_content': len(duplicate_content),
             'exact_duplicates': exact_duplicates,
-            'top_duplicate_content': list(content_counts.most_common(5)),
+            'top_duplicate_content': top_content,
         }
 
         print(f"\nDuplicate review IDs: {result['duplicate_review_ids']}")
@@ -378,7 +746,7 @@ class DataQualityAnalyzer:
 
         if duplicate_content:
             print("\nMost repeated review content:")
-            for content, count in list(content_counts.most_common(5)):
+            for content, count in top_content:
                 if count > 1 and content:
                     preview = content[:50] + "..." if len(content) > 50 else content
                     print(f"  [{count}x] \"{preview}\"")
@@ -391,43 +759,11 @@ class DataQualityAnalyzer:
         print("8. LANGUAGE & ENCODING ISSUES")
         print("-" * 70)
 
-        contents = [r.get('content', '') or '' for r in self.data]
-
-        # Non-ASCII content (potential non-English)
-        non_ascii = sum(1 for c in contents if c and not c.isascii())
-
-        # Encoding issues (common patterns)
-        encoding_issues = sum(1 for c in contents if '�' in c or '\ufffd' in c)
-
-        # HTML entities not decoded
-        html_entities = sum(1 for c in contents if '&amp;' in c or '&lt;' in c or '&#' in c)
-
-        # Detect primary scripts
-        scripts = {
-            'latin': 0,
-            'cyrillic': 0,
-            'arabic': 0,
-            'devanagari': 0,
-            'cjk': 0,
-            'other': 0,
-        }
-
-        for c in contents:
-            if not c:
-                continue
-            # Simple heuristic based on character ranges
-            if re.search(r'[а-яА-ЯёЁ]', c):
-                scripts['cyrillic'] += 1
-            elif re.search(r'[\u0600-\u06FF]', c):
-                scripts['arabic'] += 1
-            elif re.search(r'[\u0900-\u097F]', c):
-                scripts['devanagari'] += 1
-            elif re.search(r'[\u4e00-\u9fff\u3400-\u4dbf]', c):
-                scripts['cjk'] += 1
-            elif re.search(r'[a-zA-Z]', c):
-                scripts['latin'] += 1
-            else:
-                scripts['other'] += 1
+        profile = self._text_profile()
+        non_ascii = profile.non_ascii
+        encoding_issues = profile.encoding_errors
+        html_entities = profile.html_entities
+        scripts = profile.scripts
 
         result = {
             'non_ascii_reviews': non_ascii,
@@ -455,16 +791,18 @@ class DataQualityAnalyzer:
         print("9. DEVELOPER REPLIES")
         print("-" * 70)
 
-        replies = [r for r in self.data if r.get('reply_content')]
+        acc = self._scan_once()
 
-        reply_count = len(replies)
+        reply_count = acc.reply_count
         reply_pct = reply_count / self.total_reviews * 100 if self.total_reviews > 0 else 0
 
         # Reply rates by rating
+        star_totals = acc.rating_counter
+        star_replied = acc.replied_rating_counter
         reply_by_rating = {}
         for star in range(1, 6):
-            total_for_star = sum(1 for r in self.data if r.get('rating') == star)
-            replied_for_star = sum(1 for r in self.data if r.get('rating') == star and r.get('reply_content'))
+            total_for_star = star_totals[star]
+            replied_for_star = star_replied[star]
             rate = replied_for_star / total_for_star * 100 if total_for_star > 0 else 0
             reply_by_rating[star] = {
                 'total': total_for_star,
@@ -532,8 +870,33 @@ class DataQualityAnalyzer:
         print("\nDataset ready for downstream processing with noted considerations.")
 
 
+def _report_cache_key(filepath: Path) -> str:
+    """Identify a data file by name, size and mtime for report reuse."""
+    st = filepath.stat()
+    return f"{filepath.name}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _load_cached_report(report_file: Path, cache_key: str) -> Optional[Dict[str, Any]]:
+    """Return the saved report if it was built from the same data file."""
+    if not report_file.exists():
+        return None
+    try:
+        with open(report_file, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if report.get('_cache_key') != cache_key:
+        return None
+    return report
+
+
 def main():
-    """Run analysis on the latest data file."""
+    """
+    Run analysis on the latest data file.
+
+    The saved report is reused when the data file is unchanged since it
+    was written; pass --force to re-run the analysis anyway.
+    """
     import sys
 
     # Find the largest/most recent JSON file
@@ -549,14 +912,23 @@ def main():
     print(f"Analyzing: {target_file}")
     print(f"File size: {target_file.stat().st_size / 1024 / 1024:.2f} MB\n")
 
+    output_file = data_dir / "data_quality_report.json"
+    cache_key = _report_cache_key(target_file)
+    if '--force' not in sys.argv[1:]:
+        cached = _load_cached_report(output_file, cache_key)
+        if cached is not None:
+            print(f"Data file unchanged; using cached report: {output_file}")
+            return cached
+
     analyzer = DataQualityAnalyzer.from_json_file(target_file)
     results = analyzer.run_full_analysis()
+    results['_cache_key'] = cache_key
 
-    # Save results
-    output_file = data_dir / "data_quality_report.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, default=str)
+    # Save results: serialize in memory and write once, rather than
+    # streaming json.dump's many small chunks through the file object
+    output_file.write_text(json.dumps(results, indent=2, default=str), encoding='utf-8')
     print(f"\nFull report saved to: {output_file}")
+    return results
 
 
 if __name__ == "__main__":
@@ -6,41 +6,125 @@ dataset: distributions, correlations, time patterns, per-app behavior,
 and text-level quality signals relevant to downstream labeling and modeling.
 """
 
+import io
 import json
 import math
 import re
+from bisect import bisect_left, bisect_right
 from collections import Counter, defaultdict
-from datetime import datetime, timedelta
+from contextlib import redirect_stdout
+from datetime import datetime
+from functools import partial
+from itertools import accumulate, repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
-import statistics
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 import sys
 
 
+# Patterns used by the suspicious-review scan in analyze_data_quality.
+_PAT_REPEAT = re.compile(r'(.)\1{4,}')
+_PAT_LATIN = re.compile(r'[a-zA-Z]')
+_PAT_URL = re.compile(r'https?://|www\.')
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def percentile(data: List[float], p: float) -> float:
-    """Calculate p-th percentile (0-100)."""
-    if not data:
-        return 0.0
-    sorted_data = sorted(data)
-    k = (len(sorted_data) - 1) * (p / 100)
-    f = math.floor(k)
-    c = math.ceil(k)
-    if f == c:
-        return sorted_data[int(k)]
-    return sorted_data[f] * (c - k) + sorted_data[c] * (k - f)
+def _percentiles_from_counts(counts: Dict[Any, int], ps: List[float]) -> List[float]:
+    """
+    Percentiles (0-100, linear interpolation between closest ranks) of a
+    dataset given as {value: occurrences}.
+
+    Only the distinct values are sorted; each rank is resolved by
+    bisecting the cumulative counts.
+    """
+    values = sorted(counts)
+    ends = list(accumulate(counts[v] for v in values))
+    if not ends or not ends[-1]:
+        return [0.0] * len(ps)
+    n = ends[-1]
+    results = []
+    for p in ps:
+        k = (n - 1) * (p / 100)
+        f = math.floor(k)
+        c = math.ceil(k)
+        lo = values[bisect_right(ends, f)]
+        if f == c:
+            results.append(lo)
+        else:
+            results.append(lo * (c - k) + values[bisect_right(ends, c)] * (k - f))
+    return results
+
+
+def _median_from_counts(counts: Dict[Any, int]) -> float:
+    """Median of a dataset given as {value: occurrences}, as statistics.median."""
+    n = sum(counts.values())
+    lo_idx, hi_idx = (n - 1) // 2, n // 2
+    seen = 0
+    lo = None
+    for value in sorted(counts):
+        seen += counts[value]
+        if lo is None and seen > lo_idx:
+            lo = value
+        if seen > hi_idx:
+            return lo if lo_idx == hi_idx else (lo + value) / 2
+    raise ValueError("no median for empty data")
+
+
+def _moments(counts: Dict[Any, int]) -> Tuple[int, float, float, float, float]:
+    """
+    Summary moments of a dataset given as {value: occurrences}.
+
+    Returns (n, mean, sample stdev, third central moment, fourth central
+    moment); the central moments are population (divided by n), as used
+    by the Fisher-Pearson skewness and excess kurtosis.
+    """
+    n = sum(counts.values())
+    s1 = sum(x * c for x, c in counts.items())
+    s2 = sum(x * x * c for x, c in counts.items())
+    mean = s1 / n
+    stdev = math.sqrt((n * s2 - s1 * s1) / (n * (n - 1))) if n > 1 else 0
+    # Third and fourth central moments in one pass over the distinct
+    # values, with plain multiplies instead of float pow.
+    m3 = m4 = 0.0
+    for x, c in counts.items():
+        d = x - mean
+        d2 = d * d
+        m3 += d2 * d * c
+        m4 += d2 * d2 * c
+    return n, mean, stdev, m3 / n, m4 / n
+
+
+def _field(data: List[Dict], key: str, default: Any = None):
+    """Iterate r.get(key, default) over the dataset without a Python-level loop."""
+    return map(dict.get, data, repeat(key), repeat(default))
+
+
+_get_rating = itemgetter("rating")
+
+
+def _lengths_by_rating(data: List[Dict], char_lens: List[int]) -> Dict[Any, Counter]:
+    """Histogram of content lengths for each star rating."""
+    pairs = Counter(zip(map(_get_rating, data), char_lens))
+    by_rating = defaultdict(Counter)
+    for (star, length), c in pairs.items():
+        by_rating[star][length] = c
+    return by_rating
 
 
 def safe_div(a, b, default=0.0):
     return a / b if b else default
 
 
+# Bars for every fill up to the widest histogram, built once at import.
+_BARS = tuple("#" * i for i in range(41))
+
+
 def histogram_bar(value, max_value, width=40):
     filled = int(value / max_value * width) if max_value else 0
-    return "#" * filled
+    return _BARS[filled] if 0 <= filled < len(_BARS) else "#" * filled
 
 
 def section(title: str, level: int = 1):
@@ -64,12 +148,56 @@ def load_dataset(data_dir: Path) -> List[Dict[str, Any]]:
     target = max(json_files, key=lambda f: f.stat().st_size)
     print(f"Source file : {target}")
     print(f"File size   : {target.stat().st_size / 1024 / 1024:.2f} MB")
-    with open(target, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    # Decode the whole file in one call and hand the str to the C scanner,
+    # skipping TextIOWrapper's incremental decoding
+    data = json.loads(target.read_bytes().decode("utf-8"))
     print(f"Total rows  : {len(data):,}")
     return data
 
 
+class ContentColumns(NamedTuple):
+    """Per-review content columns, parallel to the dataset list."""
+    contents: List[str]
+    char_lens: List[int]
+    word_counts: List[int]
+
+
+def build_content_columns(data: List[Dict[str, Any]]) -> ContentColumns:
+    """
+    Normalize each review's content and measure it once.
+
+    Several sections need the text, its length and its word count; they
+    share these columns instead of re-deriving them from every row.
+    """
+    contents = [c or "" for c in _field(data, "content", "")]
+    return ContentColumns(
+        contents=contents,
+        char_lens=[len(c) for c in contents],
+        word_counts=[len(c.split()) for c in contents],
+    )
+
+
+def parse_timestamps(data: List[Dict[str, Any]]) -> List[Optional[datetime]]:
+    """
+    Parse each review's ISO timestamp once, parallel to the dataset list.
+
+    Missing, non-string or malformed timestamps map to None.
+    """
+    parsed = []
+    append = parsed.append
+    fromisoformat = datetime.fromisoformat
+    for r in data:
+        ts = r.get("timestamp")
+        dt = None
+        if ts and isinstance(ts, str):
+            try:
+                dt = fromisoformat(ts)
+            except ValueError:
+                pass
+        append(dt)
+    return parsed
+
+
 # ---------------------------------------------------------------------------
 # 1. Rating analysis
 # ---------------------------------------------------------------------------
@@ -77,24 +205,18 @@ def load_dataset(data_dir: Path) -> List[Dict[str, Any]]:
 def analyze_ratings(data: List[Dict]) -> None:
     section("1. RATING DISTRIBUTION & SUMMARY STATISTICS")
 
-    ratings = [r["rating"] for r in data]
-    n = len(ratings)
-    dist = Counter(ratings)
-
-    mean_r = statistics.mean(ratings)
-    median_r = statistics.median(ratings)
-    mode_r = statistics.mode(ratings)
-    stdev_r = statistics.stdev(ratings)
+    # One pass builds the star histogram; every statistic below is derived
+    # from its (at most five) distinct values rather than re-walking the rows.
+    dist = Counter(map(_get_rating, data))
+    n, mean_r, stdev_r, m3, m4 = _moments(dist)
+    median_r = _median_from_counts(dist)
+    mode_r = dist.most_common(1)[0][0]
 
     # Skewness (Fisher-Pearson)
-    skewness = (
-        sum((x - mean_r) ** 3 for x in ratings) / n
-    ) / (stdev_r ** 3) if stdev_r else 0
+    skewness = m3 / (stdev_r ** 3) if stdev_r else 0
 
     # Kurtosis (excess)
-    kurtosis = (
-        sum((x - mean_r) ** 4 for x in ratings) / n
-    ) / (stdev_r ** 4) - 3 if stdev_r else 0
+    kurtosis = m4 / (stdev_r ** 4) - 3 if stdev_r else 0
 
     print(f"\n  Count   : {n:,}")
     print(f"  Mean    : {mean_r:.3f}")
@@ -114,9 +236,9 @@ def analyze_ratings(data: List[Dict]) -> None:
         print(f"    {star}  | {c:>6} | {pct:>5.1f}% | {bar}")
 
     # Sentiment buckets
-    positive = sum(1 for r in ratings if r >= 4)
-    neutral = sum(1 for r in ratings if r == 3)
-    negative = sum(1 for r in ratings if r <= 2)
+    positive = sum(c for r, c in dist.items() if r >= 4)
+    neutral = dist.get(3, 0)
+    negative = sum(c for r, c in dist.items() if r <= 2)
     print(f"\n  Sentiment buckets (for labeling reference):")
     print(f"    Positive (4-5) : {positive:>6} ({positive/n*100:.1f}%)")
     print(f"    Neutral  (3)   : {neutral:>6} ({neutral/n*100:.1f}%)")
@@ -128,25 +250,23 @@ def analyze_ratings(data: List[Dict]) -> None:
 # 2. Text length analysis
 # ---------------------------------------------------------------------------
 
-def analyze_text_lengths(data: List[Dict]) -> None:
+def analyze_text_lengths(data: List[Dict], columns: Optional[ContentColumns] = None) -> None:
     section("2. REVIEW TEXT LENGTH DISTRIBUTIONS")
 
-    contents = [r.get("content", "") or "" for r in data]
-    char_lens = [len(c) for c in contents]
-    word_lens = [len(c.split()) for c in contents]
+    columns = columns or build_content_columns(data)
+    char_lens = columns.char_lens
+    word_lens = columns.word_counts
 
-    for label, lens in [("Character length", char_lens), ("Word count", word_lens)]:
+    # Lengths are small integers with many repeats, so every statistic
+    # below is read off a histogram rather than the full sorted list.
+    char_hist = Counter(char_lens)
+    word_hist = Counter(word_lens)
+    for label, hist in [("Character length", char_hist), ("Word count", word_hist)]:
         section(label, level=2)
-        p5 = percentile(lens, 5)
-        p25 = percentile(lens, 25)
-        p50 = percentile(lens, 50)
-        p75 = percentile(lens, 75)
-        p95 = percentile(lens, 95)
-        p99 = percentile(lens, 99)
-        mean_l = statistics.mean(lens)
-        stdev_l = statistics.stdev(lens) if len(lens) > 1 else 0
-
-        print(f"    Min     : {min(lens)}")
+        p5, p25, p50, p75, p95, p99 = _percentiles_from_counts(hist, [5, 25, 50, 75, 95, 99])
+        _, mean_l, stdev_l, _, _ = _moments(hist)
+
+        print(f"    Min     : {min(hist)}")
         print(f"    P5      : {p5:.0f}")
         print(f"    P25 (Q1): {p25:.0f}")
         print(f"    P50 (med): {p50:.0f}")
@@ -154,7 +274,7 @@ def analyze_text_lengths(data: List[Dict]) -> None:
         print(f"    P75 (Q3): {p75:.0f}")
         print(f"    P95     : {p95:.0f}")
         print(f"    P99     : {p99:.0f}")
-        print(f"    Max     : {max(lens)}")
+        print(f"    Max     : {max(hist)}")
         print(f"    Std Dev : {stdev_l:.1f}")
         print(f"    IQR     : {p75 - p25:.0f}")
 
@@ -163,10 +283,15 @@ def analyze_text_lengths(data: List[Dict]) -> None:
     buckets = [(0, 0, "empty"), (1, 10, "1-10"), (11, 25, "11-25"),
                (26, 50, "26-50"), (51, 100, "51-100"), (101, 200, "101-200"),
                (201, 350, "201-350"), (351, 500, "351-500")]
-    bucket_counts = []
-    for lo, hi, label in buckets:
-        c = sum(1 for l in char_lens if lo <= l <= hi)
-        bucket_counts.append((label, c))
+    # Buckets are contiguous from 0, so each distinct length maps to a
+    # bucket by bisecting the upper bounds; lengths past the last are dropped.
+    highs = [hi for _, hi, _ in buckets]
+    counts = [0] * len(buckets)
+    for length, c in char_hist.items():
+        idx = bisect_left(highs, length)
+        if idx < len(buckets):
+            counts[idx] += c
+    bucket_counts = [(label, c) for (_, _, label), c in zip(buckets, counts)]
     max_bc = max(c for _, c in bucket_counts)
     print(f"    {'Bucket':<12} {'Count':>7} {'%':>7}  Distribution")
     print("    " + "-" * 55)
@@ -177,31 +302,57 @@ def analyze_text_lengths(data: List[Dict]) -> None:
 
     # Length by rating
     section("Median character length by rating", level=2)
-    by_rating = defaultdict(list)
-    for r in data:
-        by_rating[r["rating"]].append(len(r.get("content", "") or ""))
+    by_rating = _lengths_by_rating(data, char_lens)
     for star in range(5, 0, -1):
-        vals = by_rating[star]
-        med = statistics.median(vals) if vals else 0
-        avg = statistics.mean(vals) if vals else 0
-        print(f"    {star} stars: median={med:>5.0f} chars, mean={avg:>6.1f} chars  (n={len(vals)})")
+        hist = by_rating[star]
+        nn, avg, _, _, _ = _moments(hist) if hist else (0, 0, 0, 0, 0)
+        med = _median_from_counts(hist) if hist else 0
+        print(f"    {star} stars: median={med:>5.0f} chars, mean={avg:>6.1f} chars  (n={nn})")
 
 
 # ---------------------------------------------------------------------------
 # 3. Temporal patterns
 # ---------------------------------------------------------------------------
 
-def analyze_temporal(data: List[Dict]) -> None:
+def analyze_temporal(data: List[Dict],
+                     parsed: Optional[List[Optional[datetime]]] = None) -> None:
     section("3. TIME-BASED PATTERNS")
 
+    if parsed is None:
+        parsed = parse_timestamps(data)
+
+    # Every distribution below is accumulated from the parsed timestamps
+    # in a single pass. Day-of-week and hour are small integer buckets,
+    # and days are keyed by date objects, so no per-row string formatting
+    # is needed. Reviews from the same day are tallied as a run and folded
+    # into the per-day totals when the day changes, so chronologically
+    # ordered dumps touch those dicts once per day rather than once per
+    # review.
     timestamps = []
-    for r in data:
-        ts = r.get("timestamp")
-        if ts and isinstance(ts, str):
-            try:
-                timestamps.append(datetime.fromisoformat(ts))
-            except ValueError:
-                pass
+    day_counts = Counter()
+    day_rating_sums = Counter()
+    dow_counts = [0] * 7
+    hour_counts = [0] * 24
+    run_day = None
+    run_n = run_sum = 0
+    for r, dt in zip(data, parsed):
+        if dt is None:
+            continue
+        timestamps.append(dt)
+        day = dt.date()
+        if day != run_day:
+            if run_n:
+                day_counts[run_day] += run_n
+                day_rating_sums[run_day] += run_sum
+            run_day = day
+            run_n = run_sum = 0
+        run_n += 1
+        run_sum += r["rating"]
+        dow_counts[dt.weekday()] += 1
+        hour_counts[dt.hour] += 1
+    if run_n:
+        day_counts[run_day] += run_n
+        day_rating_sums[run_day] += run_sum
 
     if not timestamps:
         print("  No parseable timestamps.")
@@ -217,63 +368,58 @@ def analyze_temporal(data: List[Dict]) -> None:
 
     # Daily volume
     section("Reviews per day", level=2)
-    day_counts = Counter(dt.strftime("%Y-%m-%d") for dt in timestamps)
     days_sorted = sorted(day_counts.items())
-    volumes = [c for _, c in days_sorted]
+    volumes = Counter(c for _, c in days_sorted)
     if volumes:
-        print(f"    Days with data : {len(volumes)}")
-        print(f"    Mean per day   : {statistics.mean(volumes):.1f}")
-        print(f"    Median per day : {statistics.median(volumes):.0f}")
+        n_days, mean_v, stdev_v, _, _ = _moments(volumes)
+        print(f"    Days with data : {n_days}")
+        print(f"    Mean per day   : {mean_v:.1f}")
+        print(f"    Median per day : {_median_from_counts(volumes):.0f}")
         print(f"    Min per day    : {min(volumes)}")
         print(f"    Max per day    : {max(volumes)}")
-        print(f"    Std Dev        : {statistics.stdev(volumes):.1f}" if len(volumes) > 1 else "")
+        print(f"    Std Dev        : {stdev_v:.1f}" if n_days > 1 else "")
 
     # Day-of-week distribution
     section("Reviews by day of week", level=2)
-    dow_counts = Counter(dt.strftime("%A") for dt in timestamps)
     dow_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    max_dow = max(dow_counts.values()) if dow_counts else 1
-    for day in dow_order:
-        c = dow_counts.get(day, 0)
+    max_dow = max(dow_counts)
+    for day, c in zip(dow_order, dow_counts):
         bar = histogram_bar(c, max_dow, 30)
         print(f"    {day:<12}: {c:>5}  {bar}")
 
     # Hour-of-day distribution
     section("Reviews by hour of day (UTC)", level=2)
-    hour_counts = Counter(dt.hour for dt in timestamps)
-    max_hour = max(hour_counts.values()) if hour_counts else 1
-    for h in range(24):
-        c = hour_counts.get(h, 0)
+    max_hour = max(hour_counts)
+    for h, c in enumerate(hour_counts):
         bar = histogram_bar(c, max_hour, 25)
         print(f"    {h:>2}:00 : {c:>5}  {bar}")
 
     # Average rating over time (by day)
     section("Average rating by day", level=2)
-    day_ratings = defaultdict(list)
-    for r in data:
-        ts = r.get("timestamp")
-        if ts and isinstance(ts, str):
-            try:
-                day = datetime.fromisoformat(ts).strftime("%Y-%m-%d")
-                day_ratings[day].append(r["rating"])
-            except ValueError:
-                pass
-    for day in sorted(day_ratings.keys()):
-        vals = day_ratings[day]
-        avg = statistics.mean(vals)
-        print(f"    {day}: avg={avg:.2f}  n={len(vals)}")
+    for day, count in days_sorted:
+        avg = day_rating_sums[day] / count
+        print(f"    {day}: avg={avg:.2f}  n={count}")
 
 
 # ---------------------------------------------------------------------------
 # 4. Per-app breakdown
 # ---------------------------------------------------------------------------
 
-def analyze_per_app(data: List[Dict]) -> None:
+def analyze_per_app(data: List[Dict], columns: Optional[ContentColumns] = None) -> None:
     section("4. PER-APP BREAKDOWN")
 
-    apps = defaultdict(list)
-    for r in data:
-        apps[r.get("app_id", "unknown")].append(r)
+    columns = columns or build_content_columns(data)
+    # One pass folds every review into its app's running tallies:
+    # rating histogram, total words, short reviews and replied reviews.
+    apps = defaultdict(lambda: [Counter(), 0, 0, 0])
+    for r, words in zip(data, columns.word_counts):
+        acc = apps[r.get("app_id", "unknown")]
+        acc[0][r["rating"]] += 1
+        acc[1] += words
+        if words <= 3:
+            acc[2] += 1
+        if r.get("reply_content"):
+            acc[3] += 1
 
     header = (f"    {'App':<40} {'N':>5} {'Mean':>5} {'Med':>4} "
               f"{'StdDev':>6} {'AvgWords':>8} {'Short%':>7} {'Reply%':>7}")
@@ -281,18 +427,16 @@ def analyze_per_app(data: List[Dict]) -> None:
     print("    " + "-" * (len(header) - 4))
 
     rows = []
-    for app_id, reviews in sorted(apps.items()):
-        n = len(reviews)
-        ratings = [r["rating"] for r in reviews]
-        mean_r = statistics.mean(ratings)
-        med_r = statistics.median(ratings)
-        std_r = statistics.stdev(ratings) if n > 1 else 0
-        word_counts = [len((r.get("content", "") or "").split()) for r in reviews]
-        avg_words = statistics.mean(word_counts) if word_counts else 0
-        short_pct = sum(1 for w in word_counts if w <= 3) / n * 100
-        reply_pct = sum(1 for r in reviews if r.get("reply_content")) / n * 100
+    app_means = []
+    for app_id, (rating_hist, word_total, short, replied) in sorted(apps.items()):
+        n, mean_r, std_r, _, _ = _moments(rating_hist)
+        med_r = _median_from_counts(rating_hist)
+        avg_words = word_total / n
+        short_pct = short / n * 100
+        reply_pct = replied / n * 100
 
         rows.append((app_id, n, mean_r, med_r, std_r, avg_words, short_pct, reply_pct))
+        app_means.append(mean_r)
 
     for app_id, n, mean_r, med_r, std_r, avg_words, short_pct, reply_pct in rows:
         short_name = app_id if len(app_id) <= 40 else "..." + app_id[-37:]
@@ -300,9 +444,10 @@ def analyze_per_app(data: List[Dict]) -> None:
               f"{std_r:>6.2f} {avg_words:>8.1f} {short_pct:>6.1f}% {reply_pct:>6.1f}%")
 
     # Cross-app variance
-    app_means = [statistics.mean(r["rating"] for r in revs) for revs in apps.values()]
     if len(app_means) > 1:
-        print(f"\n  Cross-app rating variance: {statistics.variance(app_means):.4f}")
+        mean_of_means = math.fsum(app_means) / len(app_means)
+        variance = math.fsum((m - mean_of_means) ** 2 for m in app_means) / (len(app_means) - 1)
+        print(f"\n  Cross-app rating variance: {variance:.4f}")
         print(f"  Cross-app rating range  : {min(app_means):.2f} - {max(app_means):.2f}")
 
 
@@ -310,13 +455,14 @@ def analyze_per_app(data: List[Dict]) -> None:
 # 5. Data quality deep-dive
 # ---------------------------------------------------------------------------
 
-def analyze_data_quality(data: List[Dict]) -> None:
+def analyze_data_quality(data: List[Dict], columns: Optional[ContentColumns] = None) -> None:
     section("5. DATA QUALITY DEEP-DIVE")
+    columns = columns or build_content_columns(data)
     n = len(data)
 
     # 5a. Duplicate analysis
     section("Duplicate review IDs", level=2)
-    id_counts = Counter(r.get("review_id", "") for r in data)
+    id_counts = Counter(_field(data, "review_id", ""))
     dup_ids = {k: v for k, v in id_counts.items() if v > 1}
     print(f"    Unique review IDs : {len(id_counts):,}")
     print(f"    Duplicate IDs     : {len(dup_ids)}")
@@ -325,7 +471,7 @@ def analyze_data_quality(data: List[Dict]) -> None:
 
     # 5b. Content duplicates (exact match)
     section("Exact content duplicates", level=2)
-    content_counts = Counter(r.get("content", "") for r in data)
+    content_counts = Counter(_field(data, "content", ""))
     dup_contents = {k: v for k, v in content_counts.items() if v > 1 and k}
     print(f"    Unique texts      : {len(content_counts):,}")
     print(f"    Repeated texts    : {len(dup_contents):,}")
@@ -348,70 +494,103 @@ def analyze_data_quality(data: List[Dict]) -> None:
     fields = list(data[0].keys()) if data else []
     print(f"    {'Field':<22} {'Present':>8} {'Null':>8} {'Empty':>8} {'Fill %':>8}")
     print("    " + "-" * 58)
+    null_counts = dict.fromkeys(fields, 0)
+    empty_counts = dict.fromkeys(fields, 0)
+    for r in data:
+        get = r.get
+        for field in fields:
+            v = get(field)
+            if v is None:
+                null_counts[field] += 1
+            elif v == "":
+                empty_counts[field] += 1
     for field in fields:
-        present = sum(1 for r in data if r.get(field) is not None and r.get(field) != "")
-        null_c = sum(1 for r in data if r.get(field) is None)
-        empty_c = sum(1 for r in data if r.get(field) == "")
+        null_c = null_counts[field]
+        empty_c = empty_counts[field]
+        present = n - null_c - empty_c
         fill_pct = present / n * 100
         print(f"    {field:<22} {present:>8} {null_c:>8} {empty_c:>8} {fill_pct:>7.1f}%")
 
     # 5d. app_version missingness by app
     section("app_version missing rate by app", level=2)
-    apps = defaultdict(lambda: {"total": 0, "missing": 0})
-    for r in data:
-        aid = r.get("app_id", "")
-        apps[aid]["total"] += 1
-        if r.get("app_version") is None or r.get("app_version") == "":
-            apps[aid]["missing"] += 1
-    for aid in sorted(apps):
-        t = apps[aid]["total"]
-        m = apps[aid]["missing"]
+    app_ids = list(_field(data, "app_id", ""))
+    totals = Counter(app_ids)
+    missing = Counter(aid for aid, version in zip(app_ids, _field(data, "app_version"))
+                      if version is None or version == "")
+    for aid in sorted(totals):
+        t = totals[aid]
+        m = missing[aid]
         pct = m / t * 100
         flag = " <--" if pct > 25 else ""
         print(f"    {aid:<45}: {m:>4}/{t:>4} missing ({pct:>5.1f}%){flag}")
 
     # 5e. Rating vs content length correlation
     section("Rating vs. review length (chars)", level=2)
-    by_rating = defaultdict(list)
-    for r in data:
-        by_rating[r["rating"]].append(len(r.get("content", "") or ""))
+    by_rating = _lengths_by_rating(data, columns.char_lens)
     print(f"    {'Star':>4}  {'N':>6}  {'Mean':>7}  {'Median':>7}  {'P95':>7}  {'%<=10ch':>8}")
     print("    " + "-" * 50)
     for star in range(5, 0, -1):
-        lens = by_rating[star]
-        nn = len(lens)
-        mn = statistics.mean(lens) if lens else 0
-        md = statistics.median(lens) if lens else 0
-        p95 = percentile(lens, 95)
-        short_pct = sum(1 for l in lens if l <= 10) / nn * 100 if nn else 0
+        hist = by_rating[star]
+        nn, mn, _, _, _ = _moments(hist) if hist else (0, 0, 0, 0, 0)
+        md = _median_from_counts(hist) if hist else 0
+        p95, = _percentiles_from_counts(hist, [95])
+        short_pct = sum(c for l, c in hist.items() if l <= 10) / nn * 100 if nn else 0
         print(f"    {star:>4}  {nn:>6}  {mn:>7.1f}  {md:>7.0f}  {p95:>7.0f}  {short_pct:>7.1f}%")
 
     # 5f. Suspicious patterns
     section("Suspicious / low-quality review patterns", level=2)
+    # Every pattern, plus the combined low-signal filter below, is checked
+    # in one pass so each review's split/strip and regex searches run once.
+    repeat_search = _PAT_REPEAT.search
+    latin_search = _PAT_LATIN.search
+    url_search = _PAT_URL.search
+    empty = single = few = upper = repeated = no_latin = punct = url = 0
+    filterable = 0
+    for c, length, words in zip(*columns):
+        # No words means empty or whitespace-only. Such text has no
+        # letters, punctuation or URLs, so only a run of repeated
+        # whitespace can still match; it is always filterable.
+        if not words:
+            empty += 1
+            filterable += 1
+            if c:
+                no_latin += 1
+                if length >= 5 and repeat_search(c):
+                    repeated += 1
+            continue
+        has_latin = latin_search(c) is not None
+        if words == 1:
+            single += 1
+        elif words <= 3:
+            few += 1
+        if length > 5 and c.isupper():
+            upper += 1
+        if length >= 5 and repeat_search(c):
+            repeated += 1
+        if not has_latin:
+            no_latin += 1
+        if length > 5 and sum(c.count(ch) for ch in '!?.,:;') / length > 0.3:
+            punct += 1
+        if url_search(c):
+            url += 1
+        # Combined: reviews that would likely be filtered before labeling
+        if words <= 2 or not has_latin:
+            filterable += 1
+
     patterns = {
-        "Empty or whitespace-only": lambda c: len(c.strip()) == 0,
-        "Single word": lambda c: len(c.split()) == 1,
-        "2-3 words": lambda c: 2 <= len(c.split()) <= 3,
-        "All uppercase (>5 chars)": lambda c: c.isupper() and len(c) > 5,
-        "Repeated chars (5+)": lambda c: bool(re.search(r'(.)\1{4,}', c)),
-        "No Latin letters": lambda c: bool(c) and not re.search(r'[a-zA-Z]', c),
-        "Excessive punctuation (>30%)": lambda c: len(c) > 5 and sum(1 for ch in c if ch in '!?.,:;') / len(c) > 0.3,
-        "URL or link present": lambda c: bool(re.search(r'https?://|www\.', c)),
+        "Empty or whitespace-only": empty,
+        "Single word": single,
+        "2-3 words": few,
+        "All uppercase (>5 chars)": upper,
+        "Repeated chars (5+)": repeated,
+        "No Latin letters": no_latin,
+        "Excessive punctuation (>30%)": punct,
+        "URL or link present": url,
     }
-    contents = [r.get("content", "") or "" for r in data]
-    for label, fn in patterns.items():
-        count = sum(1 for c in contents if fn(c))
+    for label, count in patterns.items():
         pct = count / n * 100
         flag = " [!]" if pct > 10 else ""
         print(f"    {label:<35}: {count:>6} ({pct:>5.1f}%){flag}")
-
-    # Combined: reviews that would likely be filtered before labeling
-    filterable = sum(
-        1 for c in contents
-        if len(c.strip()) == 0
-        or len(c.split()) <= 2
-        or (not re.search(r'[a-zA-Z]', c) and c)
-    )
     print(f"\n    Combined low-signal reviews     : {filterable:>6} ({filterable/n*100:.1f}%)")
     print(f"    Usable for labeling (estimated) : {n - filterable:>6} ({(n-filterable)/n*100:.1f}%)")
 
@@ -423,30 +602,38 @@ def analyze_data_quality(data: List[Dict]) -> None:
 def analyze_thumbs_up(data: List[Dict]) -> None:
     section("6. THUMBS-UP (HELPFULNESS) DISTRIBUTION")
 
-    thumbs = [r.get("thumbs_up", 0) for r in data]
-    n = len(thumbs)
-    zero = sum(1 for t in thumbs if t == 0)
+    # One pass splits zero from positive counts and groups by rating.
+    n = len(data)
+    zero = 0
+    nz_vals = []
+    by_rating = defaultdict(list)
+    for r in data:
+        t = r.get("thumbs_up", 0)
+        by_rating[r["rating"]].append(t)
+        if t == 0:
+            zero += 1
+        elif t > 0:
+            nz_vals.append(t)
     nonzero = n - zero
 
     print(f"\n  Zero thumbs-up : {zero:>6} ({zero/n*100:.1f}%)")
     print(f"  Non-zero       : {nonzero:>6} ({nonzero/n*100:.1f}%)")
 
     if nonzero:
-        nz_vals = [t for t in thumbs if t > 0]
+        nz_hist = Counter(nz_vals)
+        _, nz_mean, _, _, _ = _moments(nz_hist)
+        p95, = _percentiles_from_counts(nz_hist, [95])
         print(f"\n  Among non-zero:")
-        print(f"    Mean   : {statistics.mean(nz_vals):.1f}")
-        print(f"    Median : {statistics.median(nz_vals):.0f}")
-        print(f"    P95    : {percentile(nz_vals, 95):.0f}")
-        print(f"    Max    : {max(nz_vals)}")
+        print(f"    Mean   : {nz_mean:.1f}")
+        print(f"    Median : {_median_from_counts(nz_hist):.0f}")
+        print(f"    P95    : {p95:.0f}")
+        print(f"    Max    : {max(nz_hist)}")
 
     # Thumbs-up by rating
     section("Mean thumbs-up by rating", level=2)
-    by_rating = defaultdict(list)
-    for r in data:
-        by_rating[r["rating"]].append(r.get("thumbs_up", 0))
     for star in range(5, 0, -1):
         vals = by_rating[star]
-        avg = statistics.mean(vals) if vals else 0
+        avg = sum(vals) / len(vals) if vals else 0
         nz = sum(1 for v in vals if v > 0)
         print(f"    {star} stars: mean={avg:>6.2f}, non-zero={nz:>4} ({nz/len(vals)*100:.1f}%)")
 
@@ -458,29 +645,39 @@ def analyze_thumbs_up(data: List[Dict]) -> None:
 def analyze_replies(data: List[Dict]) -> None:
     section("7. DEVELOPER REPLY ANALYSIS")
 
-    replied = [r for r in data if r.get("reply_content")]
-    unreplied = [r for r in data if not r.get("reply_content")]
+    # One pass collects reply lengths, per-app reply tallies and the
+    # rating totals for replied vs unreplied reviews.
+    reply_lens = []
+    replied_ratings = 0
+    unreplied_ratings = 0
+    apps = defaultdict(lambda: {"total": 0, "replied": 0})
+    for r in data:
+        app = apps[r.get("app_id", "")]
+        app["total"] += 1
+        reply = r.get("reply_content")
+        if reply:
+            app["replied"] += 1
+            reply_lens.append(len(reply))
+            replied_ratings += r["rating"]
+        else:
+            unreplied_ratings += r["rating"]
     n = len(data)
-    nr = len(replied)
+    nr = len(reply_lens)
+    nu = n - nr
 
     print(f"\n  Replied   : {nr:>6} ({nr/n*100:.1f}%)")
-    print(f"  Unreplied : {len(unreplied):>6} ({len(unreplied)/n*100:.1f}%)")
+    print(f"  Unreplied : {nu:>6} ({nu/n*100:.1f}%)")
 
-    if replied:
-        reply_lens = [len(r["reply_content"]) for r in replied]
+    if nr:
+        len_hist = Counter(reply_lens)
+        p95, = _percentiles_from_counts(len_hist, [95])
         print(f"\n  Reply text length:")
-        print(f"    Mean   : {statistics.mean(reply_lens):.1f} chars")
-        print(f"    Median : {statistics.median(reply_lens):.0f} chars")
-        print(f"    P95    : {percentile(reply_lens, 95):.0f} chars")
+        print(f"    Mean   : {sum(reply_lens) / nr:.1f} chars")
+        print(f"    Median : {_median_from_counts(len_hist):.0f} chars")
+        print(f"    P95    : {p95:.0f} chars")
 
     # Reply rate by app
     section("Reply rate by app", level=2)
-    apps = defaultdict(lambda: {"total": 0, "replied": 0})
-    for r in data:
-        aid = r.get("app_id", "")
-        apps[aid]["total"] += 1
-        if r.get("reply_content"):
-            apps[aid]["replied"] += 1
     for aid in sorted(apps):
         t = apps[aid]["total"]
         rr = apps[aid]["replied"]
@@ -488,9 +685,9 @@ def analyze_replies(data: List[Dict]) -> None:
         print(f"    {aid:<45}: {rr:>4}/{t:>4} ({pct:>5.1f}%)")
 
     # Avg rating: replied vs unreplied
-    if replied and unreplied:
-        avg_replied = statistics.mean(r["rating"] for r in replied)
-        avg_unreplied = statistics.mean(r["rating"] for r in unreplied)
+    if nr and nu:
+        avg_replied = replied_ratings / nr
+        avg_unreplied = unreplied_ratings / nu
         print(f"\n  Avg rating (replied)   : {avg_replied:.2f}")
         print(f"  Avg rating (unreplied) : {avg_unreplied:.2f}")
         print(f"  Delta                  : {avg_replied - avg_unreplied:+.2f}")
@@ -500,6 +697,25 @@ def analyze_replies(data: List[Dict]) -> None:
 # Main
 # ---------------------------------------------------------------------------
 
+def _capture(run) -> str:
+    """Run one section with stdout collected in memory; return the text."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        run()
+    return buf.getvalue()
+
+
+def run_sections(sections: List) -> None:
+    """
+    Run the analysis sections and print them in order.
+
+    Each section's output is collected in memory and written with one
+    call, instead of one stdout write per printed line.
+    """
+    for run in sections:
+        sys.stdout.write(_capture(run))
+
+
 def main():
     data = load_dataset(Path("data"))
 
@@ -507,13 +723,18 @@ def main():
     print(f"#  DEEP DESCRIPTIVE ANALYSIS")
     print(f"{'#' * 72}")
 
-    analyze_ratings(data)
-    analyze_text_lengths(data)
-    analyze_temporal(data)
-    analyze_per_app(data)
-    analyze_data_quality(data)
-    analyze_thumbs_up(data)
-    analyze_replies(data)
+    columns = build_content_columns(data)
+    parsed = parse_timestamps(data)
+
+    run_sections([
+        partial(analyze_ratings, data),
+        partial(analyze_text_lengths, data, columns),
+        partial(analyze_temporal, data, parsed),
+        partial(analyze_per_app, data, columns),
+        partial(analyze_data_quality, data, columns),
+        partial(analyze_thumbs_up, data),
+        partial(analyze_replies, data),
+    ])
 
     section("END OF ANALYSIS")
     print("  All checks complete.\n")
@@ -11,7 +11,6 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
@@ -41,7 +40,7 @@ def cmd_load(args):
         print(f"File not found: {json_path}")
         return 1
 
-    db = DatabaseManager(args.database)
+    db = DatabaseManager(args.database, fast_load=args.fast_load)
     db.init_schema()  # Ensure schema exists
 
     print(f"Loading reviews from: {json_path}")
@@ -103,9 +102,14 @@ def cmd_stats(args):
 
 def cmd_query(args):
     """Query reviews."""
-    db = DatabaseManager(args.database)
+    after_ts = after_id = None
+    if args.after:
+        after_ts, sep, after_id = args.after.partition("|")
+        if not sep:
+            print("--after expects a cursor of the form 'TIMESTAMP|REVIEW_ID'")
+            return 1
 
-    reviews = db.get_reviews(
+    filters = dict(
         app_id=args.app,
         rating=args.rating,
         min_rating=args.min_rating,
@@ -114,17 +118,25 @@ def cmd_query(args):
         min_length=args.min_length,
         limit=args.limit,
         offset=args.offset,
+        after_ts=after_ts,
+        after_id=after_id,
     )
 
+    db = DatabaseManager(args.database)
     if args.format == "json":
-        print(json.dumps(reviews, indent=2, default=str))
+        # Serialized by SQLite; no per-row dicts on the way out
+        print(db.get_reviews_json(**filters))
     else:
+        reviews = db.get_reviews(**filters)
         print(f"\nFound {len(reviews)} reviews:\n")
         for r in reviews:
             print(f"[{r['rating']}*] {r['app_id']}")
             print(f"    {r['content'][:100]}{'...' if len(r['content']) > 100 else ''}")
             print(f"    -- {r['author']}, {r['review_timestamp']}")
             print()
+        if len(reviews) == args.limit:
+            last = reviews[-1]
+            print(f"Next page: --after '{last['review_timestamp']}|{last['review_id']}'")
 
     db.close()
     return 0
@@ -173,6 +185,10 @@ def main():
     # load
     load_parser = subparsers.add_parser("load", help="Load reviews from JSON file")
     load_parser.add_argument("file", help="Path to JSON file")
+    load_parser.add_argument(
+        "--fast-load", action="store_true",
+        help="Disable fsync during the bulk insert (unsafe on OS crash)"
+    )
 
     # stats
     subparsers.add_parser("stats", help="Show database statistics")
@@ -187,6 +203,10 @@ def main():
     query_parser.add_argument("--min-length", type=int, help="Minimum content length")
     query_parser.add_argument("--limit", type=int, default=10, help="Max results")
     query_parser.add_argument("--offset", type=int, default=0, help="Pagination offset")
+    query_parser.add_argument(
+        "--after",
+        help="Keyset cursor 'TIMESTAMP|REVIEW_ID' from the previous page (fast deep paging)"
+    )
     query_parser.add_argument(
         "--format", choices=["text", "json"], default="text",
         help="Output format"
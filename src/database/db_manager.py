@@ -7,14 +7,165 @@ Compatible with SQLite (default) and PostgreSQL.
 
 import json
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple
 
 from src.models.review import Review, AppInfo
+from src.utils.json_stream import iter_json_array
 from src.utils.logger import get_logger
 
 
+# Applied to every new connection. WAL lets readers (CLI stats, labeling)
+# run alongside the ingestion writer and turns commits into sequential
+# log appends; with WAL, synchronous=NORMAL only fsyncs at checkpoints
+# and stays crash-safe.
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -100000",      # ~100 MB page cache
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",     # 256 MB memory-mapped I/O
+    "PRAGMA busy_timeout = 5000",       # ms to wait on a locked database
+)
+
+# Prepared statements kept per connection. The module default (128) is
+# shared with every ad-hoc query; a larger cache keeps the hot INSERTs
+# compiled for the life of the connection.
+STATEMENT_CACHE_SIZE = 256
+
+# Columns of the reviews table, in SELECT * order
+REVIEW_COLUMNS = (
+    "review_id", "app_id", "author", "rating", "content",
+    "review_timestamp", "scraped_at", "thumbs_up", "app_version",
+    "reply_content", "reply_timestamp",
+)
+
+# Hot write statements, shared by the single-row and bulk paths so they
+# hit the same cached prepared statement.
+INSERT_REVIEW_SQL = """
+    INSERT OR IGNORE INTO reviews (
+        review_id, app_id, author, rating, content,
+        review_timestamp, scraped_at, thumbs_up, app_version,
+        reply_content, reply_timestamp
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPSERT_APP_SQL = """
+    INSERT INTO apps (
+        app_id, title, developer, genre,
+        play_store_rating, play_store_reviews, installs,
+        first_scraped_at, last_scraped_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(app_id) DO UPDATE SET
+        title = excluded.title,
+        developer = excluded.developer,
+        genre = excluded.genre,
+        play_store_rating = excluded.play_store_rating,
+        play_store_reviews = excluded.play_store_reviews,
+        installs = excluded.installs,
+        last_scraped_at = excluded.last_scraped_at
+"""
+
+# reviews_fts is maintained here rather than by an insert trigger: rows
+# added since the MAX(rowid) taken before a load are indexed in one statement.
+MAX_REVIEW_ROWID_SQL = "SELECT COALESCE(MAX(rowid), 0) FROM reviews"
+
+# Secondary indexes on reviews, with their CREATE statements (the primary
+# key's automatic index has no stored SQL and is left alone)
+REVIEW_INDEXES_SQL = """
+    SELECT name, sql FROM sqlite_master
+    WHERE type = 'index' AND tbl_name = 'reviews' AND sql IS NOT NULL
+"""
+
+INDEX_NEW_REVIEWS_SQL = """
+    INSERT INTO reviews_fts (rowid, content)
+    SELECT rowid, content FROM reviews WHERE rowid > ?
+"""
+
+INSERT_APP_STUB_SQL = """
+    INSERT OR IGNORE INTO apps (app_id, title, developer)
+    VALUES (?, ?, ?)
+"""
+
+INSERT_SCRAPE_LOG_SQL = """
+    INSERT OR IGNORE INTO review_scrape_log (review_id, run_id)
+    VALUES (?, ?)
+"""
+
+# A load refreshes planner statistics with ANALYZE only when it adds at
+# least this fraction of the rows already stored. ANALYZE rescans every
+# table and index, so small incremental inserts (one per app per
+# scheduler run) leave it to the PRAGMA optimize run on close().
+ANALYZE_MIN_GROWTH = 0.1
+
+# JSON dumps up to this size are parsed in a single C-level call, which
+# is about twice as fast as element-by-element streaming; larger files
+# are streamed so memory stays bounded.
+WHOLE_FILE_JSON_MAX_BYTES = 32 * 1024 * 1024
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of up to size items."""
+    items = iter(items)
+    while True:
+        batch = list(islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _review_rows(batch: List[Review]) -> List[Tuple]:
+    """INSERT_REVIEW_SQL parameter tuples for a batch of reviews."""
+    return [
+        (
+            r.review_id,
+            r.app_id,
+            r.author,
+            r.rating,
+            r.content,
+            r.timestamp.isoformat() if r.timestamp else None,
+            r.scraped_at.isoformat() if r.scraped_at else None,
+            r.thumbs_up,
+            r.app_version,
+            r.reply_content,
+            r.reply_timestamp.isoformat() if r.reply_timestamp else None,
+        )
+        for r in batch
+    ]
+
+
+def _record_rows(records: List[Dict[str, Any]]) -> List[Tuple]:
+    """Parameter tuples for a batch of raw JSON records."""
+    return _review_rows([Review.from_dict(r) for r in records])
+
+
+def _query_dicts(
+    conn: sqlite3.Connection, sql: str, params: Iterable[Any] = ()
+) -> List[Dict[str, Any]]:
+    """
+    Run a query and return its rows as dicts.
+
+    Rows come off the cursor as plain tuples and are zipped with the column
+    names, skipping the fetchall() list and the per-row sqlite3.Row objects.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql, params)
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+
+def _iter_json_records(json_path: Path) -> Iterator[Dict[str, Any]]:
+    """Iterate the records of a JSON array file, parsing whole or streaming by size."""
+    if json_path.stat().st_size <= WHOLE_FILE_JSON_MAX_BYTES:
+        return iter(json.loads(json_path.read_bytes()))
+    return iter_json_array(json_path)
+
+
 class DatabaseManager:
     """
     Manages database connections and operations for review data.
@@ -22,14 +173,18 @@ class DatabaseManager:
     Handles schema initialization, bulk loading, and querying.
     """
 
-    def __init__(self, db_path: str = "data/reviews.db"):
+    def __init__(self, db_path: str = "data/reviews.db", fast_load: bool = False):
         """
         Initialize database manager.
 
         Args:
             db_path: Path to SQLite database file
+            fast_load: Skip fsync entirely (synchronous=OFF) while bulk
+                inserting. Faster, but an OS crash mid-load can corrupt
+                the database; use for rebuildable loads only.
         """
         self.db_path = Path(db_path)
+        self.fast_load = fast_load
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.logger = get_logger("database")
         self._conn: Optional[sqlite3.Connection] = None
@@ -37,17 +192,28 @@ class DatabaseManager:
     def connect(self) -> sqlite3.Connection:
         """Get or create database connection."""
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn = sqlite3.connect(
+                str(self.db_path), cached_statements=STATEMENT_CACHE_SIZE
+            )
             self._conn.row_factory = sqlite3.Row
-            # Enable foreign keys
-            self._conn.execute("PRAGMA foreign_keys = ON")
+            # Foreign keys, WAL journaling and cache sizing
+            for pragma in CONNECTION_PRAGMAS:
+                self._conn.execute(pragma)
         return self._conn
 
     def close(self):
         """Close database connection."""
         if self._conn:
-            self._conn.close()
-            self._conn = None
+            # Let SQLite refresh statistics the queries on this connection
+            # would have benefited from; a no-op when nothing changed.
+            # Best-effort: a locked database must not keep us from closing.
+            try:
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                self.logger.warning(f"PRAGMA optimize skipped: {e}")
+            finally:
+                self._conn.close()
+                self._conn = None
 
     def __enter__(self):
         self.connect()
@@ -71,7 +237,20 @@ class DatabaseManager:
             schema_sql = f.read()
 
         conn = self.connect()
+        had_fts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'reviews_fts'"
+        ).fetchone()
         conn.executescript(schema_sql)
+        if not had_fts:
+            # Index reviews stored before the search table existed
+            conn.execute("INSERT INTO reviews_fts(reviews_fts) VALUES ('rebuild')")
+        # Seed planner statistics once for databases that predate them;
+        # bulk loads refresh them afterwards
+        has_stats = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        if not has_stats:
+            conn.execute("ANALYZE")
         conn.commit()
         self.logger.info(f"Database schema initialized: {self.db_path}")
 
@@ -107,21 +286,7 @@ class DatabaseManager:
         """
         conn = self.connect()
         try:
-            conn.execute("""
-                INSERT INTO apps (
-                    app_id, title, developer, genre,
-                    play_store_rating, play_store_reviews, installs,
-                    first_scraped_at, last_scraped_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(app_id) DO UPDATE SET
-                    title = excluded.title,
-                    developer = excluded.developer,
-                    genre = excluded.genre,
-                    play_store_rating = excluded.play_store_rating,
-                    play_store_reviews = excluded.play_store_reviews,
-                    installs = excluded.installs,
-                    last_scraped_at = excluded.last_scraped_at
-            """, (
+            conn.execute(UPSERT_APP_SQL, (
                 app_info.app_id,
                 app_info.title,
                 app_info.developer,
@@ -150,13 +315,7 @@ class DatabaseManager:
         """
         conn = self.connect()
         try:
-            conn.execute("""
-                INSERT OR IGNORE INTO reviews (
-                    review_id, app_id, author, rating, content,
-                    review_timestamp, scraped_at, thumbs_up, app_version,
-                    reply_content, reply_timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor = conn.execute(INSERT_REVIEW_SQL, (
                 review.review_id,
                 review.app_id,
                 review.author,
@@ -169,6 +328,11 @@ class DatabaseManager:
                 review.reply_content,
                 review.reply_timestamp.isoformat() if review.reply_timestamp else None,
             ))
+            if cursor.rowcount:
+                conn.execute(
+                    "INSERT INTO reviews_fts (rowid, content) VALUES (?, ?)",
+                    (cursor.lastrowid, review.content)
+                )
             conn.commit()
             return True
         except Exception as e:
@@ -177,56 +341,122 @@ class DatabaseManager:
 
     def insert_reviews_bulk(
         self,
-        reviews: List[Review],
-        batch_size: int = 1000
+        reviews: Iterable[Review],
+        batch_size: int = 1000,
+        run_id: Optional[int] = None
     ) -> Tuple[int, int]:
         """
         Bulk insert reviews for performance.
 
         Args:
-            reviews: List of Review objects
+            reviews: Review objects; any iterable, consumed batch by batch
             batch_size: Number of reviews per batch
+            run_id: If given, also link each review to this scrape run in
+                review_scrape_log, in the same transaction as the insert
 
         Returns:
             Tuple of (inserted_count, skipped_count)
         """
         conn = self.connect()
+        batches = map(_review_rows, _batched(reviews, batch_size))
+        with self._bulk_sync(conn):
+            inserted, skipped = self._insert_review_batches(
+                conn, batches, run_id=run_id
+            )
+
+        self.logger.info(f"Bulk insert complete: {inserted} inserted, {skipped} skipped")
+        return inserted, skipped
+
+    @contextmanager
+    def _bulk_sync(self, conn: sqlite3.Connection):
+        """Turn fsync off for the duration of a bulk load when fast_load is set."""
+        if not self.fast_load:
+            yield
+            return
+        conn.execute("PRAGMA synchronous = OFF")
+        try:
+            yield
+        finally:
+            conn.execute("PRAGMA synchronous = NORMAL")
+
+    def _insert_review_batches(
+        self,
+        conn: sqlite3.Connection,
+        batches: Iterable[List[Tuple]],
+        before_batch: Optional[Callable[[List[Tuple]], None]] = None,
+        rebuild_indexes: bool = False,
+        run_id: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """
+        Insert batches of review parameter tuples; returns (inserted, skipped).
+
+        The whole load is one transaction with a single commit at the end.
+        Each batch runs under its own savepoint, so a failing batch is
+        rolled back on its own and counted as skipped while the others
+        still land. before_batch, if given, runs on each batch ahead of
+        its savepoint (e.g. to register the batch's apps). With run_id,
+        each batch's reviews are also logged against that scrape run
+        under the same savepoint.
+
+        With rebuild_indexes, the secondary indexes on reviews are dropped
+        for the load and recreated from their stored definitions at the
+        end, in the same transaction: building an index once is cheaper
+        than updating it row by row, as long as the table held little
+        before the load.
+
+        Planner statistics are refreshed after the commit when the load
+        grew the table by at least ANALYZE_MIN_GROWTH.
+        """
         inserted = 0
         skipped = 0
 
-        for i in range(0, len(reviews), batch_size):
-            batch = reviews[i:i + batch_size]
-            try:
-                cursor = conn.executemany("""
-                    INSERT OR IGNORE INTO reviews (
-                        review_id, app_id, author, rating, content,
-                        review_timestamp, scraped_at, thumbs_up, app_version,
-                        reply_content, reply_timestamp
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, [
-                    (
-                        r.review_id,
-                        r.app_id,
-                        r.author,
-                        r.rating,
-                        r.content,
-                        r.timestamp.isoformat() if r.timestamp else None,
-                        r.scraped_at.isoformat() if r.scraped_at else None,
-                        r.thumbs_up,
-                        r.app_version,
-                        r.reply_content,
-                        r.reply_timestamp.isoformat() if r.reply_timestamp else None,
-                    )
-                    for r in batch
-                ])
-                conn.commit()
-                inserted += cursor.rowcount
-                skipped += len(batch) - cursor.rowcount
-            except Exception as e:
-                self.logger.error(f"Batch insert failed: {e}")
-                skipped += len(batch)
+        try:
+            # Open the transaction explicitly: the sqlite3 module only does
+            # so before DML, and a SAVEPOINT outside a transaction starts
+            # one of its own that its RELEASE then commits.
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            dropped_indexes = []
+            if rebuild_indexes:
+                dropped_indexes = conn.execute(REVIEW_INDEXES_SQL).fetchall()
+                for name, _ in dropped_indexes:
+                    conn.execute(f"DROP INDEX {name}")
+            last_rowid = conn.execute(MAX_REVIEW_ROWID_SQL).fetchone()[0]
+            for batch in batches:
+                if before_batch is not None:
+                    before_batch(batch)
+                conn.execute("SAVEPOINT review_batch")
+                try:
+                    cursor = conn.executemany(INSERT_REVIEW_SQL, batch)
+                    if run_id is not None:
+                        conn.executemany(
+                            INSERT_SCRAPE_LOG_SQL,
+                            [(row[0], run_id) for row in batch]
+                        )
+                except Exception as e:
+                    conn.execute("ROLLBACK TO review_batch")
+                    self.logger.error(f"Batch insert failed: {e}")
+                    skipped += len(batch)
+                else:
+                    inserted += cursor.rowcount
+                    skipped += len(batch) - cursor.rowcount
+                finally:
+                    conn.execute("RELEASE review_batch")
+            for _, create_sql in dropped_indexes:
+                conn.execute(create_sql)
+            # Index all new rows in one pass: FTS5 writes a new segment at
+            # every savepoint, so per-batch indexing leaves many small
+            # segments to merge.
+            conn.execute(INDEX_NEW_REVIEWS_SQL, (last_rowid,))
+            conn.commit()
+            # Refresh planner statistics when the row counts moved enough
+            # to matter; last_rowid approximates the earlier row count
+            if inserted and inserted >= last_rowid * ANALYZE_MIN_GROWTH:
+                conn.execute("ANALYZE")
+        except Exception:
+            conn.rollback()
+            raise
 
-        self.logger.info(f"Bulk insert complete: {inserted} inserted, {skipped} skipped")
         return inserted, skipped
 
     def load_from_json(self, json_path: Path) -> Tuple[int, int]:
@@ -239,25 +469,55 @@ class DatabaseManager:
         Returns:
             Tuple of (inserted_count, skipped_count)
         """
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        reviews = [Review.from_dict(r) for r in data]
-        self.logger.info(f"Loaded {len(reviews)} reviews from {json_path}")
-
-        # Extract unique apps and insert them first
+        # Reviews are built and inserted batch by batch; large dumps are
+        # also streamed from the file, so memory stays bounded by a few batches.
+        json_path = Path(json_path)
+        batches = map(_record_rows, _batched(_iter_json_records(json_path), 1000))
+        conn = self.connect()
         apps_seen = set()
-        for r in reviews:
-            if r.app_id not in apps_seen:
-                # Create minimal AppInfo (we don't have full metadata in review JSON)
-                self.connect().execute("""
-                    INSERT OR IGNORE INTO apps (app_id, title, developer)
-                    VALUES (?, ?, ?)
-                """, (r.app_id, r.app_id, "Unknown"))
-                apps_seen.add(r.app_id)
-        self.connect().commit()
-
-        return self.insert_reviews_bulk(reviews)
+        duplicates = 0
+
+        def new_rows(batches: Iterable[List[Tuple]]) -> Iterator[List[Tuple]]:
+            # Drop repeats within a batch (first one wins, as with INSERT OR
+            # IGNORE) and reviews already stored: one indexed id lookup is
+            # far cheaper than binding and attempting the whole row, and
+            # re-loads of a dump are mostly duplicates.
+            nonlocal duplicates
+            for batch in batches:
+                unique = {}
+                for row in batch:
+                    unique.setdefault(row[0], row)
+                existing = self.get_existing_review_ids(unique.keys())
+                rows = [row for review_id, row in unique.items() if review_id not in existing]
+                duplicates += len(batch) - len(rows)
+                if rows:
+                    yield rows
+
+        def register_apps(batch: List[Tuple]) -> None:
+            # Create minimal AppInfo rows (we don't have full metadata in
+            # review JSON) for apps first seen in this batch, ahead of the
+            # reviews that reference them.
+            new_apps = dict.fromkeys(row[1] for row in batch if row[1] not in apps_seen)
+            if new_apps:
+                conn.executemany(
+                    INSERT_APP_STUB_SQL,
+                    [(app_id, app_id, "Unknown") for app_id in new_apps]
+                )
+                apps_seen.update(new_apps)
+
+        # Loading into an empty table: build the secondary indexes once at
+        # the end instead of maintaining them row by row
+        is_empty = conn.execute("SELECT 1 FROM reviews LIMIT 1").fetchone() is None
+
+        with self._bulk_sync(conn):
+            inserted, skipped = self._insert_review_batches(
+                conn, new_rows(batches), before_batch=register_apps,
+                rebuild_indexes=is_empty
+            )
+        skipped += duplicates
+        self.logger.info(f"Loaded {inserted + skipped} reviews from {json_path}")
+        self.logger.info(f"Bulk insert complete: {inserted} inserted, {skipped} skipped")
+        return inserted, skipped
 
     # -------------------------------------------------------------------------
     # Scrape run tracking
@@ -337,10 +597,16 @@ class DatabaseManager:
         has_reply: Optional[bool] = None,
         min_length: Optional[int] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        after_ts: Optional[str] = None,
+        after_id: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
-        Query reviews with flexible filters.
+        Query reviews with flexible filters, newest first.
+
+        For deep paging pass the review_timestamp and review_id of the
+        last row of the previous page as after_ts/after_id instead of a
+        large offset: the query then seeks straight to the next page.
 
         Args:
             app_id: Filter by app
@@ -351,11 +617,51 @@ class DatabaseManager:
             min_length: Minimum content length
             limit: Max results to return
             offset: Pagination offset
+            after_ts: Keyset cursor timestamp (requires after_id)
+            after_id: Keyset cursor review_id (requires after_ts)
 
         Returns:
             List of review dictionaries
         """
-        conn = self.connect()
+        query, params = self._reviews_query(
+            app_id, rating, min_rating, max_rating, has_reply, min_length,
+            limit, offset, after_ts, after_id
+        )
+        return _query_dicts(self.connect(), query, params)
+
+    def get_reviews_json(self, **filters: Any) -> str:
+        """
+        Run the get_reviews query and return the rows as a JSON array string.
+
+        Takes the same keyword filters as get_reviews. SQLite builds each
+        row's JSON object, so no per-row dicts or json.dumps pass are
+        needed. The objects come straight from the ordered query and are
+        joined here: json_group_array over an ordered subquery would keep
+        the order only by planner accident (ORDER BY inside the aggregate
+        needs SQLite 3.44).
+        """
+        fields = ", ".join(f"'{column}', {column}" for column in REVIEW_COLUMNS)
+        query, params = self._reviews_query(
+            columns=f"json_object({fields})", **filters
+        )
+        rows = self.connect().execute(query, params)
+        return "[" + ",".join(row[0] for row in rows) + "]"
+
+    def _reviews_query(
+        self,
+        app_id: Optional[str] = None,
+        rating: Optional[int] = None,
+        min_rating: Optional[int] = None,
+        max_rating: Optional[int] = None,
+        has_reply: Optional[bool] = None,
+        min_length: Optional[int] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after_ts: Optional[str] = None,
+        after_id: Optional[str] = None,
+        columns: str = "*"
+    ) -> Tuple[str, List[Any]]:
+        """Build the get_reviews SQL and parameters for the given filters."""
         conditions = []
         params = []
 
@@ -379,31 +685,33 @@ class DatabaseManager:
         if min_length is not None:
             conditions.append("LENGTH(content) >= ?")
             params.append(min_length)
+        if after_ts is not None or after_id is not None:
+            if after_ts is None or after_id is None:
+                raise ValueError("after_ts and after_id must be given together")
+            conditions.append("(review_timestamp, review_id) < (?, ?)")
+            params.extend([after_ts, after_id])
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
         params.extend([limit, offset])
 
         query = f"""
-            SELECT * FROM reviews
+            SELECT {columns} FROM reviews
             WHERE {where_clause}
-            ORDER BY review_timestamp DESC
+            ORDER BY review_timestamp DESC, review_id DESC
             LIMIT ? OFFSET ?
         """
 
-        rows = conn.execute(query, params).fetchall()
-        return [dict(row) for row in rows]
+        return query, params
 
     def get_app_stats(self) -> List[Dict[str, Any]]:
         """Get aggregated stats for all apps."""
         conn = self.connect()
-        rows = conn.execute("SELECT * FROM v_app_stats").fetchall()
-        return [dict(row) for row in rows]
+        return _query_dicts(conn, "SELECT * FROM v_app_stats")
 
     def get_daily_stats(self) -> List[Dict[str, Any]]:
         """Get daily review volume and rating trends."""
         conn = self.connect()
-        rows = conn.execute("SELECT * FROM v_daily_stats").fetchall()
-        return [dict(row) for row in rows]
+        return _query_dicts(conn, "SELECT * FROM v_daily_stats")
 
     def get_sentiment_distribution(
         self,
@@ -416,18 +724,21 @@ class DatabaseManager:
             Dict with keys 'positive', 'neutral', 'negative'
         """
         conn = self.connect()
-        query = """
-            SELECT
-                SUM(CASE WHEN rating >= 4 THEN 1 ELSE 0 END) AS positive,
-                SUM(CASE WHEN rating = 3 THEN 1 ELSE 0 END) AS neutral,
-                SUM(CASE WHEN rating <= 2 THEN 1 ELSE 0 END) AS negative
-            FROM reviews
-        """
+        # Three range counts over the rating indexes instead of CASE
+        # buckets evaluated row by row
         if app_id:
-            query += " WHERE app_id = ?"
-            row = conn.execute(query, (app_id,)).fetchone()
+            where = "app_id = ? AND "
+            params = (app_id,) * 3
         else:
-            row = conn.execute(query).fetchone()
+            where = ""
+            params = ()
+        query = f"""
+            SELECT
+                (SELECT COUNT(*) FROM reviews WHERE {where}rating >= 4) AS positive,
+                (SELECT COUNT(*) FROM reviews WHERE {where}rating = 3) AS neutral,
+                (SELECT COUNT(*) FROM reviews WHERE {where}rating <= 2) AS negative
+        """
+        row = conn.execute(query, params).fetchone()
 
         return {
             "positive": row["positive"],
@@ -442,22 +753,34 @@ class DatabaseManager:
         limit: int = 100
     ) -> List[Dict[str, Any]]:
         """
-        Search reviews by content (simple LIKE query).
+        Search reviews by content (substring match, as LIKE '%query%').
 
-        For production, consider FTS5 for full-text search.
+        Queries of 3 or more characters are narrowed through the trigram
+        index in reviews_fts first; the LIKE then keeps the exact matching
+        rules. Shorter queries, and ones containing LIKE wildcards, which
+        trigrams cannot prefilter, scan reviews directly.
         """
         conn = self.connect()
         params = [f"%{query}%"]
 
-        sql = "SELECT * FROM reviews WHERE content LIKE ?"
+        if len(query) < 3 or "%" in query or "_" in query:
+            sql = "SELECT * FROM reviews r WHERE r.content LIKE ?"
+        else:
+            # Quote as an FTS5 string so punctuation in user input is not
+            # parsed as query syntax
+            params.insert(0, '"' + query.replace('"', '""') + '"')
+            sql = (
+                "SELECT r.* FROM reviews_fts f"
+                " JOIN reviews r ON r.rowid = f.rowid"
+                " WHERE reviews_fts MATCH ? AND r.content LIKE ?"
+            )
         if app_id:
-            sql += " AND app_id = ?"
+            sql += " AND r.app_id = ?"
             params.append(app_id)
-        sql += " ORDER BY thumbs_up DESC LIMIT ?"
+        sql += " ORDER BY r.thumbs_up DESC LIMIT ?"
         params.append(limit)
 
-        rows = conn.execute(sql, params).fetchall()
-        return [dict(row) for row in rows]
+        return _query_dicts(conn, sql, params)
 
     # -------------------------------------------------------------------------
     # Database info
@@ -499,7 +822,7 @@ class DatabaseManager:
 
         conn = self.connect()
         cursor = conn.executemany(
-            "INSERT OR IGNORE INTO review_scrape_log (review_id, run_id) VALUES (?, ?)",
+            INSERT_SCRAPE_LOG_SQL,
             [(rid, run_id) for rid in review_ids]
         )
         conn.commit()
@@ -509,20 +832,15 @@ class DatabaseManager:
         """Get overall database statistics."""
         conn = self.connect()
 
-        total_reviews = conn.execute(
-            "SELECT COUNT(*) FROM reviews"
-        ).fetchone()[0]
-
-        total_apps = conn.execute(
-            "SELECT COUNT(*) FROM apps"
-        ).fetchone()[0]
-
-        avg_rating = conn.execute(
-            "SELECT AVG(rating) FROM reviews"
-        ).fetchone()[0]
-
-        date_range = conn.execute("""
-            SELECT MIN(review_timestamp), MAX(review_timestamp)
+        # One pass over the rating index for COUNT and AVG; MIN and MAX stay
+        # separate subqueries so each is a single lookup on the timestamp index
+        total_reviews, avg_rating, earliest, latest, total_apps = conn.execute("""
+            SELECT
+                COUNT(*),
+                AVG(rating),
+                (SELECT MIN(review_timestamp) FROM reviews),
+                (SELECT MAX(review_timestamp) FROM reviews),
+                (SELECT COUNT(*) FROM apps)
             FROM reviews
         """).fetchone()
 
@@ -530,13 +848,19 @@ class DatabaseManager:
             "total_reviews": total_reviews,
             "total_apps": total_apps,
             "avg_rating": round(avg_rating, 2) if avg_rating else None,
-            "earliest_review": date_range[0],
-            "latest_review": date_range[1],
-            "db_file_size_mb": round(
-                self.db_path.stat().st_size / 1024 / 1024, 2
-            ) if self.db_path.exists() else 0,
+            "earliest_review": earliest,
+            "latest_review": latest,
+            "db_file_size_mb": round(self._file_size_bytes() / 1024 / 1024, 2),
         }
 
+    def _file_size_bytes(self) -> int:
+        """Size on disk, counting pages still held in the WAL file."""
+        total = 0
+        for path in (self.db_path, Path(f"{self.db_path}-wal")):
+            if path.exists():
+                total += path.stat().st_size
+        return total
+
     # -------------------------------------------------------------------------
     # Labeling: annotators
     # -------------------------------------------------------------------------
@@ -590,10 +914,9 @@ class DatabaseManager:
     def get_labels_for_review(self, review_id: str) -> List[Dict[str, Any]]:
         """Get all labels for a specific review."""
         conn = self.connect()
-        rows = conn.execute(
-            "SELECT * FROM labels WHERE review_id = ?", (review_id,)
-        ).fetchall()
-        return [dict(row) for row in rows]
+        return _query_dicts(
+            conn, "SELECT * FROM labels WHERE review_id = ?", (review_id,)
+        )
 
     def get_label_count(self, annotator_id: Optional[int] = None) -> int:
         """Get total label count, optionally filtered by annotator."""
@@ -702,6 +1025,17 @@ class DatabaseManager:
         """, (status, queue_id))
         conn.commit()
 
+    def release_queue_items(self, queue_ids: List[int]) -> None:
+        """Return assigned queue items to the pending pool in one transaction."""
+        conn = self.connect()
+        conn.executemany("""
+            UPDATE label_queue
+            SET status = 'pending', completed_at = CURRENT_TIMESTAMP,
+                assigned_to = NULL, assigned_at = NULL
+            WHERE queue_id = ?
+        """, [(queue_id,) for queue_id in queue_ids])
+        conn.commit()
+
     def reset_abandoned_assignments(self, annotator_id: int) -> int:
         """Reset assigned-but-incomplete queue items back to pending."""
         conn = self.connect()
@@ -796,14 +1130,13 @@ class DatabaseManager:
     ) -> List[Dict[str, Any]]:
         """Get recent labeling sessions."""
         conn = self.connect()
-        rows = conn.execute("""
+        return _query_dicts(conn, """
             SELECT ls.*, a.name AS annotator_name
             FROM label_sessions ls
             JOIN annotators a ON ls.annotator_id = a.annotator_id
             ORDER BY ls.session_id DESC
             LIMIT ?
-        """, (limit,)).fetchall()
-        return [dict(row) for row in rows]
+        """, (limit,))
 
     # -------------------------------------------------------------------------
     # Labeling: stats & queries
@@ -872,7 +1205,7 @@ class DatabaseManager:
         with their labels for agreement computation.
         """
         conn = self.connect()
-        rows = conn.execute("""
+        return _query_dicts(conn, """
             SELECT l1.review_id,
                    l1.annotator_id AS annotator_1,
                    l1.sentiment AS label_1,
@@ -881,8 +1214,7 @@ class DatabaseManager:
             FROM labels l1
             JOIN labels l2 ON l1.review_id = l2.review_id
                           AND l1.annotator_id < l2.annotator_id
-        """).fetchall()
-        return [dict(row) for row in rows]
+        """)
 
     def get_labeled_reviews(
         self, min_confidence: Optional[str] = None
@@ -894,12 +1226,9 @@ class DatabaseManager:
             threshold = confidence_order.get(min_confidence, 3)
             valid = [k for k, v in confidence_order.items() if v <= threshold]
             placeholders = ",".join("?" * len(valid))
-            rows = conn.execute(
+            return _query_dicts(
+                conn,
                 f"SELECT * FROM v_labeled_reviews WHERE confidence IN ({placeholders})",
                 valid
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                "SELECT * FROM v_labeled_reviews"
-            ).fetchall()
-        return [dict(row) for row in rows]
+            )
+        return _query_dicts(conn, "SELECT * FROM v_labeled_reviews")
@@ -170,25 +170,41 @@ CREATE INDEX IF NOT EXISTS idx_reviews_app_id
 CREATE INDEX IF NOT EXISTS idx_reviews_rating
     ON reviews(rating);
 
+-- Composite: rating + time (newest 1-star reviews without a sort step)
+CREATE INDEX IF NOT EXISTS idx_reviews_rating_timestamp_len
+    ON reviews(rating, review_timestamp, review_id, LENGTH(content));
+
 -- Composite: app + rating (e.g., "all 1-star reviews for WhatsApp")
 CREATE INDEX IF NOT EXISTS idx_reviews_app_rating
     ON reviews(app_id, rating);
 
--- Time-based queries (temporal analysis, incremental updates)
-CREATE INDEX IF NOT EXISTS idx_reviews_timestamp
-    ON reviews(review_timestamp);
+-- Time-based queries (temporal analysis, incremental updates). In the time
+-- indexes review_id breaks timestamp ties in get_reviews's ORDER BY and lets
+-- it page by a (timestamp, id) keyset; the trailing LENGTH(content) lets a
+-- min_length filter be checked from the index entry instead of reading each
+-- row's content. The original timestamp indexes, which they replace, are
+-- dropped from existing databases.
+DROP INDEX IF EXISTS idx_reviews_timestamp;
+DROP INDEX IF EXISTS idx_reviews_app_timestamp;
+
+CREATE INDEX IF NOT EXISTS idx_reviews_timestamp_len
+    ON reviews(review_timestamp, review_id, LENGTH(content));
 
 CREATE INDEX IF NOT EXISTS idx_reviews_scraped_at
     ON reviews(scraped_at);
 
 -- Composite: app + time (e.g., "WhatsApp reviews from last week")
-CREATE INDEX IF NOT EXISTS idx_reviews_app_timestamp
-    ON reviews(app_id, review_timestamp);
+CREATE INDEX IF NOT EXISTS idx_reviews_app_timestamp_len
+    ON reviews(app_id, review_timestamp, review_id, LENGTH(content));
 
 -- Reply presence (for filtering replied/unreplied)
 CREATE INDEX IF NOT EXISTS idx_reviews_has_reply
     ON reviews(app_id, reply_content IS NOT NULL);
 
+-- Partial: newest replied reviews (only rows with a reply are indexed)
+CREATE INDEX IF NOT EXISTS idx_reviews_with_reply
+    ON reviews(review_timestamp, review_id) WHERE reply_content IS NOT NULL;
+
 -- Thumbs up (for finding "helpful" reviews)
 CREATE INDEX IF NOT EXISTS idx_reviews_thumbs_up
     ON reviews(thumbs_up DESC);
@@ -200,6 +216,34 @@ CREATE INDEX IF NOT EXISTS idx_scrape_runs_status
 CREATE INDEX IF NOT EXISTS idx_review_scrape_log_run
     ON review_scrape_log(run_id);
 
+-- ============================================================================
+-- FULL-TEXT SEARCH
+-- ============================================================================
+-- FTS5 trigram index over review content, used by search_reviews to
+-- narrow substring searches before the LIKE check.
+-- External-content table: the text itself stays in reviews. New rows are
+-- indexed by DatabaseManager as part of each insert (one INSERT ... SELECT
+-- per bulk load is far cheaper than a per-row trigger); the triggers below
+-- cover deletes and content edits.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS reviews_fts USING fts5(
+    content,
+    content='reviews',
+    content_rowid='rowid',
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS reviews_ad AFTER DELETE ON reviews BEGIN
+    INSERT INTO reviews_fts(reviews_fts, rowid, content)
+        VALUES ('delete', old.rowid, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS reviews_au AFTER UPDATE OF content ON reviews BEGIN
+    INSERT INTO reviews_fts(reviews_fts, rowid, content)
+        VALUES ('delete', old.rowid, old.content);
+    INSERT INTO reviews_fts(rowid, content) VALUES (new.rowid, new.content);
+END;
+
 -- ============================================================================
 -- VIEWS
 -- ============================================================================
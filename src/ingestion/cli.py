@@ -32,11 +32,13 @@ Usage:
 
 import argparse
 import sys
+from pathlib import Path
 from typing import Dict, List, Any
 
-from src.ingestion.scheduler import IngestionScheduler
-from src.ingestion.reporter import IngestionReporter
-from src.database.db_manager import DatabaseManager
+# The scheduler, reporter, monitor and database modules are imported inside
+# the branch that uses them, so --help and argument errors return before
+# any of them load. Every mode still loads the scraper stack: reporter and
+# monitor import it through pipeline.
 from src.config.settings import (
     DEFAULT_TARGET_APPS,
     INGESTION_INTERVAL_SECONDS,
@@ -92,13 +94,11 @@ def main():
 
     args = parser.parse_args()
 
-    target_apps = (
-        [a.strip() for a in args.apps.split(",")]
-        if args.apps else DEFAULT_TARGET_APPS
-    )
-
     # Report-only modes
     if args.history:
+        from src.database.db_manager import DatabaseManager
+        from src.ingestion.reporter import IngestionReporter
+
         db = DatabaseManager(args.database)
         reporter = IngestionReporter()
         reporter.report_run_history(db)
@@ -106,6 +106,9 @@ def main():
         return 0
 
     if args.stats:
+        from src.database.db_manager import DatabaseManager
+        from src.ingestion.reporter import IngestionReporter
+
         db = DatabaseManager(args.database)
         reporter = IngestionReporter()
         reporter.report_db_growth(db)
@@ -114,31 +117,36 @@ def main():
 
     # Health report modes
     if args.health:
-        from src.ingestion.monitor import IngestionMonitor
-
-        db = DatabaseManager(args.database)
-        db.init_schema()
-        monitor = IngestionMonitor(db=db)
-        reports = monitor.get_recent_health_reports(limit=1)
+        db = _open_health_db(args.database)
+        reports = []
+        if db is not None:
+            from src.ingestion.monitor import IngestionMonitor
+
+            monitor = IngestionMonitor(db=db)
+            reports = monitor.get_recent_health_reports(limit=1)
+            db.close()
         if reports:
             _print_health_report(reports[0])
         else:
             print("\n  No health reports available yet.\n")
-        db.close()
         return 0
 
     if args.health_history is not None:
-        from src.ingestion.monitor import IngestionMonitor
-
-        db = DatabaseManager(args.database)
-        db.init_schema()
-        monitor = IngestionMonitor(db=db)
-        reports = monitor.get_recent_health_reports(limit=args.health_history)
-        _print_health_summary(reports)
-        db.close()
+        db = _open_health_db(args.database)
+        summaries = []
+        if db is not None:
+            from src.ingestion.monitor import IngestionMonitor
+
+            monitor = IngestionMonitor(db=db)
+            summaries = monitor.get_recent_health_summaries(
+                limit=args.health_history
+            )
+            db.close()
+        _print_health_summary(summaries)
         return 0
 
     if args.backfill_metrics:
+        from src.database.db_manager import DatabaseManager
         from src.ingestion.monitor import IngestionMonitor
 
         db = DatabaseManager(args.database)
@@ -151,6 +159,16 @@ def main():
         return 0
 
     # Ingestion mode
+    from src.ingestion.scheduler import IngestionScheduler
+
+    # Skip empty entries from stray commas ("com.a,,com.b", "com.a,")
+    target_apps = (
+        [a.strip() for a in args.apps.split(",") if a.strip()]
+        if args.apps else DEFAULT_TARGET_APPS
+    )
+    if not target_apps:
+        parser.error("--apps: no app IDs given")
+
     scheduler = IngestionScheduler(
         target_apps=target_apps,
         interval_seconds=args.interval,
@@ -162,6 +180,30 @@ def main():
     return 0
 
 
+def _open_health_db(db_path: str):
+    """
+    Open the database for the read-only health modes.
+
+    Returns None when no health report can exist yet: the database file
+    or its ingestion_metrics table is missing. Nothing is created on disk
+    in that case (no init_schema, no empty database file).
+    """
+    if not Path(db_path).is_file():
+        return None
+
+    from src.database.db_manager import DatabaseManager
+
+    db = DatabaseManager(db_path)
+    has_metrics = db.connect().execute(
+        "SELECT 1 FROM sqlite_master "
+        "WHERE type = 'table' AND name = 'ingestion_metrics'"
+    ).fetchone()
+    if not has_metrics:
+        db.close()
+        return None
+    return db
+
+
 # -------------------------------------------------------------------------
 # Display helpers
 # -------------------------------------------------------------------------
@@ -170,65 +212,55 @@ def _print_health_report(report: Dict[str, Any]) -> None:
     """Pretty-print a single health report."""
     m = report["metrics"]
     dq = report["data_quality"]
-    deltas = report["deltas"]
+    vs_previous = report["deltas"].get("vs_previous")
+    vs_avg = report["deltas"].get("vs_avg_last_5")
 
     div = "=" * 70
-    print(f"\n{div}")
-    print(
+    lines = [
+        "",
+        div,
         f"  HEALTH REPORT - Run #{report['run_id']}  |  "
-        f"{report['timestamp'][:19]}"
-    )
-    print(f"  Status: {report['status']}")
-    print(div)
-
-    print(f"\n  Performance:")
-    print(f"    Reviews inserted     : {m['reviews_inserted']:,}")
-    print(f"    Reviews fetched      : {m['reviews_fetched']:,}")
-    print(f"    Dedup rate           : {m['dedup_rate']*100:.1f}%")
-    print(f"    Error rate           : {m['error_rate']*100:.1f}%")
-    print(f"    Duration             : {m['duration_seconds']:.0f}s")
-    print(
+        f"{report['timestamp'][:19]}",
+        f"  Status: {report['status']}",
+        div,
+        "",
+        "  Performance:",
+        f"    Reviews inserted     : {m['reviews_inserted']:,}",
+        f"    Reviews fetched      : {m['reviews_fetched']:,}",
+        f"    Dedup rate           : {m['dedup_rate']:.1%}",
+        f"    Error rate           : {m['error_rate']:.1%}",
+        f"    Duration             : {m['duration_seconds']:.0f}s",
         f"    Ingestion rate       : "
-        f"{m['ingestion_rate_per_min']:.0f} reviews/min"
-    )
-    print(
+        f"{m['ingestion_rate_per_min']:.0f} reviews/min",
         f"    Apps                 : "
-        f"{m['apps_processed']} ok, {m['apps_failed']} failed"
-    )
-
-    print(f"\n  Data Quality:")
-    print(
-        f"    app_version null     : {dq['app_version_null_rate']*100:.1f}%  "
-        f"(baseline {dq['app_version_null_rate_baseline']*100:.1f}%, "
-        f"shift {dq['app_version_null_rate_shift_pct']:+.1f}pp)"
-    )
-    print(
-        f"    reply_content null   : {dq['reply_content_null_rate']*100:.1f}%  "
-        f"(baseline {dq['reply_content_null_rate_baseline']*100:.1f}%, "
-        f"shift {dq['reply_content_null_rate_shift_pct']:+.1f}pp)"
-    )
-    print(
-        f"    empty content        : {dq['empty_content_rate']*100:.1f}%"
-    )
-    print(
+        f"{m['apps_processed']} ok, {m['apps_failed']} failed",
+        "",
+        "  Data Quality:",
+        f"    app_version null     : {dq['app_version_null_rate']:.1%}  "
+        f"(baseline {dq['app_version_null_rate_baseline']:.1%}, "
+        f"shift {dq['app_version_null_rate_shift_pct']:+.1f}pp)",
+        f"    reply_content null   : {dq['reply_content_null_rate']:.1%}  "
+        f"(baseline {dq['reply_content_null_rate_baseline']:.1%}, "
+        f"shift {dq['reply_content_null_rate_shift_pct']:+.1f}pp)",
+        f"    empty content        : {dq['empty_content_rate']:.1%}",
         f"    avg content length   : {dq['avg_content_length']:.0f} chars  "
-        f"(baseline {dq['avg_content_length_baseline']:.0f})"
-    )
+        f"(baseline {dq['avg_content_length_baseline']:.0f})",
+    ]
 
-    if deltas.get("vs_previous"):
-        print(f"\n  Delta vs Previous Run:")
-        for metric, d in deltas["vs_previous"].items():
-            print(
+    if vs_previous:
+        lines.extend(["", "  Delta vs Previous Run:"])
+        for metric, d in vs_previous.items():
+            lines.append(
                 f"    {metric:<22}: {d['current']:>8.0f}  "
                 f"(was {d['previous']:.0f}, "
                 f"{d['change_pct']:+.1f}%)"
             )
 
-    if deltas.get("vs_avg_last_5"):
-        print(f"\n  Delta vs Last-5 Average:")
-        for metric, d in deltas["vs_avg_last_5"].items():
+    if vs_avg:
+        lines.extend(["", "  Delta vs Last-5 Average:"])
+        for metric, d in vs_avg.items():
             z_str = f", z={d['z_score']:.1f}" if d.get("z_score") else ""
-            print(
+            lines.append(
                 f"    {metric:<22}: {d['current']:>8.0f}  "
                 f"(avg {d['baseline']:.0f}, "
                 f"{d['deviation_pct']:+.1f}%{z_str})"
@@ -236,49 +268,51 @@ def _print_health_report(report: Dict[str, Any]) -> None:
 
     alerts = report.get("alerts", [])
     if alerts:
-        print(f"\n  Alerts ({len(alerts)}):")
+        lines.extend(["", f"  Alerts ({len(alerts)}):"])
         for a in alerts:
             prefix = (
                 "[WARNING]" if a["level"] == "WARNING" else "[INFO   ]"
             )
-            print(f"    {prefix} {a['message']}")
+            lines.append(f"    {prefix} {a['message']}")
     else:
-        print(f"\n  Alerts: None")
+        lines.extend(["", "  Alerts: None"])
 
-    print(f"\n{div}\n")
+    lines.extend(["", div, ""])
+    print("\n".join(lines))
 
 
-def _print_health_summary(reports: List[Dict[str, Any]]) -> None:
+def _print_health_summary(summaries: List[Dict[str, Any]]) -> None:
     """Print tabular summary of multiple health reports."""
-    if not reports:
+    if not summaries:
         print("\n  No health reports available.\n")
         return
 
     div = "=" * 100
-    print(f"\n{div}")
-    print(f"  Health Summary - Last {len(reports)} Runs")
-    print(div)
-    print(
+    lines = [
+        "",
+        div,
+        f"  Health Summary - Last {len(summaries)} Runs",
+        div,
         f"  {'Run':>4}  {'Timestamp':<20} {'Status':<10} "
         f"{'Inserted':>8} {'Dedup%':>7} {'Err%':>5} "
-        f"{'Dur(s)':>7} {'Alerts':>7}"
-    )
-    print("  " + "-" * 94)
+        f"{'Dur(s)':>7} {'Alerts':>7}",
+        "  " + "-" * 94,
+    ]
 
-    for r in reports:
-        m = r["metrics"]
-        print(
+    for r in summaries:
+        lines.append(
             f"  {r['run_id']:>4}  "
             f"{r['timestamp'][:19]:<20} "
             f"{r['status']:<10} "
-            f"{m['reviews_inserted']:>8} "
-            f"{m['dedup_rate']*100:>6.1f}% "
-            f"{m['error_rate']*100:>4.1f}% "
-            f"{m['duration_seconds']:>7.0f} "
-            f"{len(r.get('alerts', [])):>7}"
+            f"{r['reviews_inserted']:>8} "
+            f"{r['dedup_rate']:>7.1%} "
+            f"{r['error_rate']:>5.1%} "
+            f"{r['duration_seconds']:>7.0f} "
+            f"{r['alerts_count']:>7}"
         )
 
-    print(f"{div}\n")
+    lines.extend([div, ""])
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -8,16 +8,28 @@ ingestion_metrics table for trend analysis.
 
 import json
 import logging
-import statistics
+import math
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 
 from src.ingestion.pipeline import RunResult, AppRunResult
 from src.database.db_manager import DatabaseManager
 from src.utils.logger import setup_logger
 
 
+INSERT_METRICS_SQL = """
+    INSERT OR REPLACE INTO ingestion_metrics (
+        run_id, report_json,
+        reviews_inserted, reviews_fetched, reviews_skipped,
+        dedup_rate, error_rate, duration_seconds,
+        ingestion_rate_per_min, apps_processed, apps_failed,
+        app_version_null_rate, reply_content_null_rate,
+        empty_content_rate, alerts_count
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 # =========================================================================
 # Dataclasses
 # =========================================================================
@@ -31,6 +43,15 @@ class Alert:
     threshold: Optional[float] = None
     actual_value: Optional[float] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "level": self.level,
+            "metric": self.metric,
+            "message": self.message,
+            "threshold": self.threshold,
+            "actual_value": self.actual_value,
+        }
+
 
 @dataclass
 class HealthReport:
@@ -52,7 +73,7 @@ class HealthReport:
             "metrics": self.metrics,
             "deltas": self.deltas,
             "data_quality": self.data_quality,
-            "alerts": [asdict(a) for a in self.alerts],
+            "alerts": [a.to_dict() for a in self.alerts],
             "app_health": self.app_health,
         }
 
@@ -88,6 +109,8 @@ class IngestionMonitor:
             "ingestion.monitor", log_file="ingestion.log"
         )
         self.lookback_window = lookback_window
+        # (highest reviews rowid, baseline row) from _baseline_quality
+        self._baseline_cache: Optional[Tuple[Any, Any]] = None
 
     # -----------------------------------------------------------------
     # Main entry point
@@ -158,6 +181,9 @@ class IngestionMonitor:
         """Compare current run against recent history."""
         conn = self.db.connect()
 
+        # The unary + keeps the planner off idx_scrape_runs_status, which
+        # would collect every earlier completed run and sort them; walking
+        # run_id backwards stops after lookback_window matches.
         rows = conn.execute("""
             SELECT run_id, total_reviews_collected,
                    CAST(
@@ -165,7 +191,7 @@ class IngestionMonitor:
                        * 86400 AS REAL
                    ) AS duration_sec
             FROM scrape_runs
-            WHERE run_id < ? AND status IN ('completed', 'partial')
+            WHERE run_id < ? AND +status IN ('completed', 'partial')
               AND completed_at IS NOT NULL
             ORDER BY run_id DESC
             LIMIT ?
@@ -185,17 +211,20 @@ class IngestionMonitor:
         )
 
         # vs average of last 5
+        # Plain arithmetic: statistics.mean/stdev compute exact fractions,
+        # which buys nothing for values rounded to 2 places
         window = rows[:5]
-        avg_ins = statistics.mean(
-            [r["total_reviews_collected"] for r in window]
-        )
-        avg_dur = statistics.mean(
-            [(r["duration_sec"] or 0) for r in window]
-        )
+        inserted = [r["total_reviews_collected"] for r in window]
+        durations = [(r["duration_sec"] or 0) for r in window]
+        avg_ins = self._mean(inserted)
+        avg_dur = self._mean(durations)
 
         std_ins = (
-            statistics.stdev([r["total_reviews_collected"] for r in window])
-            if len(window) > 1 else 0
+            math.sqrt(
+                sum((x - avg_ins) ** 2 for x in inserted)
+                / (len(inserted) - 1)
+            )
+            if len(inserted) > 1 else 0
         )
 
         vs_avg = {}
@@ -228,19 +257,7 @@ class IngestionMonitor:
             WHERE rsl.run_id = ?
         """, (run_id,)).fetchone()
 
-        # Overall baseline
-        base = conn.execute("""
-            SELECT
-                COUNT(*) AS total,
-                SUM(CASE WHEN app_version IS NULL THEN 1 ELSE 0 END)
-                    AS null_version,
-                SUM(CASE WHEN reply_content IS NULL THEN 1 ELSE 0 END)
-                    AS null_reply,
-                SUM(CASE WHEN content IS NULL OR content = '' THEN 1 ELSE 0 END)
-                    AS empty_content,
-                AVG(LENGTH(content)) AS avg_len
-            FROM reviews
-        """).fetchone()
+        base = self._baseline_quality(conn)
 
         ct = cur["total"] or 1
         bt = base["total"] or 1
@@ -269,6 +286,34 @@ class IngestionMonitor:
             "avg_content_length_baseline": round(base["avg_len"] or 0, 1),
         }
 
+    def _baseline_quality(self, conn):
+        """
+        Overall null/empty counts and average length across all reviews.
+
+        This is a full scan of reviews, so the row is reused for as long
+        as the table's highest rowid is unchanged. Reviews are only ever
+        inserted, so a new rowid is what moves the baseline. A backfill,
+        which evaluates many runs against the same table, scans it once.
+        """
+        high = conn.execute("SELECT MAX(rowid) FROM reviews").fetchone()[0]
+        if self._baseline_cache and self._baseline_cache[0] == high:
+            return self._baseline_cache[1]
+
+        base = conn.execute("""
+            SELECT
+                COUNT(*) AS total,
+                SUM(CASE WHEN app_version IS NULL THEN 1 ELSE 0 END)
+                    AS null_version,
+                SUM(CASE WHEN reply_content IS NULL THEN 1 ELSE 0 END)
+                    AS null_reply,
+                SUM(CASE WHEN content IS NULL OR content = '' THEN 1 ELSE 0 END)
+                    AS empty_content,
+                AVG(LENGTH(content)) AS avg_len
+            FROM reviews
+        """).fetchone()
+        self._baseline_cache = (high, base)
+        return base
+
     # -----------------------------------------------------------------
     # Anomaly detection
     # -----------------------------------------------------------------
@@ -423,36 +468,8 @@ class IngestionMonitor:
     def store_report(self, report: HealthReport) -> None:
         """Persist health report to ingestion_metrics table."""
         conn = self.db.connect()
-        m = report.metrics
-        dq = report.data_quality
-
         try:
-            conn.execute("""
-                INSERT OR REPLACE INTO ingestion_metrics (
-                    run_id, report_json,
-                    reviews_inserted, reviews_fetched, reviews_skipped,
-                    dedup_rate, error_rate, duration_seconds,
-                    ingestion_rate_per_min, apps_processed, apps_failed,
-                    app_version_null_rate, reply_content_null_rate,
-                    empty_content_rate, alerts_count
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                report.run_id,
-                json.dumps(report.to_dict(), indent=2),
-                m["reviews_inserted"],
-                m["reviews_fetched"],
-                m["reviews_skipped"],
-                m["dedup_rate"],
-                m["error_rate"],
-                m["duration_seconds"],
-                m["ingestion_rate_per_min"],
-                m["apps_processed"],
-                m["apps_failed"],
-                dq["app_version_null_rate"],
-                dq["reply_content_null_rate"],
-                dq["empty_content_rate"],
-                len(report.alerts),
-            ))
+            conn.execute(INSERT_METRICS_SQL, self._metrics_row(report))
             conn.commit()
             self.logger.info(
                 f"Stored health report for run #{report.run_id}"
@@ -460,6 +477,29 @@ class IngestionMonitor:
         except Exception as e:
             self.logger.error(f"Failed to store health report: {e}")
 
+    @staticmethod
+    def _metrics_row(report: HealthReport) -> Tuple:
+        """Parameters for INSERT_METRICS_SQL from a health report."""
+        m = report.metrics
+        dq = report.data_quality
+        return (
+            report.run_id,
+            json.dumps(report.to_dict(), separators=(",", ":")),
+            m["reviews_inserted"],
+            m["reviews_fetched"],
+            m["reviews_skipped"],
+            m["dedup_rate"],
+            m["error_rate"],
+            m["duration_seconds"],
+            m["ingestion_rate_per_min"],
+            m["apps_processed"],
+            m["apps_failed"],
+            dq["app_version_null_rate"],
+            dq["reply_content_null_rate"],
+            dq["empty_content_rate"],
+            len(report.alerts),
+        )
+
     def get_recent_health_reports(
         self, limit: int = 10
     ) -> List[Dict[str, Any]]:
@@ -473,6 +513,29 @@ class IngestionMonitor:
         """, (limit,)).fetchall()
         return [json.loads(row["report_json"]) for row in rows]
 
+    def get_recent_health_summaries(
+        self, limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Headline figures of recent runs, for tabular summaries.
+
+        Reads the denormalized metric columns and pulls timestamp and
+        status out of report_json in SQL, so the full reports are never
+        parsed in Python.
+        """
+        conn = self.db.connect()
+        rows = conn.execute("""
+            SELECT run_id,
+                   json_extract(report_json, '$.timestamp') AS timestamp,
+                   json_extract(report_json, '$.status') AS status,
+                   reviews_inserted, dedup_rate, error_rate,
+                   duration_seconds, alerts_count
+            FROM ingestion_metrics
+            ORDER BY run_id DESC
+            LIMIT ?
+        """, (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
     # -----------------------------------------------------------------
     # Console output
     # -----------------------------------------------------------------
@@ -531,21 +594,45 @@ class IngestionMonitor:
             ORDER BY sr.run_id
         """).fetchall()
 
-        backfilled = 0
+        reports = []
         for row in runs:
             try:
                 result = self._reconstruct_run_result(row)
-                report = self.evaluate_run(result)
-                self.store_report(report)
-                backfilled += 1
-                self.logger.info(
-                    f"  Backfilled run #{row['run_id']}"
-                )
+                reports.append(self.evaluate_run(result))
             except Exception as e:
                 self.logger.error(
                     f"  Failed to backfill run #{row['run_id']}: {e}"
                 )
 
+        # Store every report in one transaction rather than a commit per
+        # run. Each insert runs under its own savepoint, so a run that
+        # fails to store is rolled back and skipped on its own.
+        stored = []
+        try:
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            for report in reports:
+                conn.execute("SAVEPOINT backfill_run")
+                try:
+                    conn.execute(INSERT_METRICS_SQL, self._metrics_row(report))
+                except Exception as e:
+                    conn.execute("ROLLBACK TO backfill_run")
+                    self.logger.error(
+                        f"  Failed to backfill run #{report.run_id}: {e}"
+                    )
+                else:
+                    stored.append(report.run_id)
+                finally:
+                    conn.execute("RELEASE backfill_run")
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            self.logger.error(f"Failed to store backfilled reports: {e}")
+            return 0
+
+        for run_id in stored:
+            self.logger.info(f"  Backfilled run #{run_id}")
+        backfilled = len(stored)
         self.logger.info(f"Backfill complete: {backfilled} runs processed")
         return backfilled
 
@@ -614,6 +701,18 @@ class IngestionMonitor:
     # Helpers
     # -----------------------------------------------------------------
 
+    @staticmethod
+    def _mean(values: List[float]) -> float:
+        """
+        Arithmetic mean. A whole-number mean of ints stays an int, as with
+        statistics.mean, so stored reports keep 347 rather than 347.0.
+        """
+        total = sum(values)
+        n = len(values)
+        if isinstance(total, int) and total % n == 0:
+            return total // n
+        return total / n
+
     @staticmethod
     def _change(previous: float, current: float) -> Dict[str, Any]:
         pct = (current - previous) / previous * 100 if previous else 0
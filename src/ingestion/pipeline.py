@@ -206,14 +206,13 @@ class IngestionPipeline:
             ]
             app_result.reviews_skipped = len(reviews) - len(new_reviews)
 
-            # 4. Insert only new reviews
+            # 4. Insert only new reviews, logging the linkage in
+            #    review_scrape_log in the same transaction
             if new_reviews:
-                inserted, _ = db.insert_reviews_bulk(new_reviews)
+                inserted, _ = db.insert_reviews_bulk(
+                    new_reviews, run_id=run_id
+                )
                 app_result.reviews_inserted = inserted
-
-                # 5. Log the linkage in review_scrape_log
-                new_ids = [r.review_id for r in new_reviews]
-                db.log_review_scrape_bulk(new_ids, run_id)
             else:
                 app_result.reviews_inserted = 0
 
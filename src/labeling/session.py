@@ -103,19 +103,9 @@ class LabelingSession:
                 # User quit
                 quit_early = True
                 # Mark remaining assigned items as pending
-                for remaining in reviews[idx:]:
-                    self.db.complete_queue_item(
-                        remaining["queue_id"], status="pending"
-                    )
-                    # Also reset assignment
-                    conn = self.db.connect()
-                    conn.execute("""
-                        UPDATE label_queue
-                        SET status = 'pending', assigned_to = NULL,
-                            assigned_at = NULL
-                        WHERE queue_id = ?
-                    """, (remaining["queue_id"],))
-                    conn.commit()
+                self.db.release_queue_items(
+                    [remaining["queue_id"] for remaining in reviews[idx:]]
+                )
                 break
 
             if sentiment == "skip":
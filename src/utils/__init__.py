@@ -1,2 +1,3 @@
 # Utils module
 from .logger import setup_logger, get_logger
+from .json_stream import iter_json_array
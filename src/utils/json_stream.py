@@ -0,0 +1,77 @@
+"""
+Streaming reader for large JSON array files.
+
+Review dumps are single top-level JSON arrays; decoding them element by
+element keeps memory bounded by one review instead of the whole file.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterator
+
+
+_JSON_WS = re.compile(r'[ \t\n\r]*')
+_JSON_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+
+def iter_json_array(filepath: Path, chunk_size: int = 1 << 20) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array one at a time.
+
+    The file is read in chunks and each element is decoded with
+    JSONDecoder.raw_decode, so peak memory is bounded by the largest
+    element plus one chunk rather than by the whole parsed list.
+    """
+    decoder = json.JSONDecoder()
+    with open(filepath, 'r', encoding='utf-8') as f:
+        buf = ''
+        pos = 0
+        state = 'open'  # open -> first -> (sep -> value)* -> done
+
+        while True:
+            pos = _JSON_WS.match(buf, pos).end()
+            if pos == len(buf):
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise ValueError(f"Unexpected end of JSON array in {filepath}")
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+
+            ch = buf[pos]
+            if state == 'open':
+                if ch != '[':
+                    raise ValueError(f"Expected a JSON array in {filepath}")
+                pos += 1
+                state = 'first'
+            elif state == 'sep':
+                if ch == ']':
+                    return
+                if ch != ',':
+                    raise ValueError(f"Malformed JSON array in {filepath} near {ch!r}")
+                pos += 1
+                state = 'value'
+            else:
+                if state == 'first' and ch == ']':
+                    return
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                    error = None
+                except json.JSONDecodeError as e:
+                    item, end, error = None, None, e
+                # An element that fails to decode, runs up to the end of the
+                # buffer, or is a number cut off mid-literal (e.g. "2." of
+                # "2.5") may be truncated; read more and retry.
+                if (end is None or end == len(buf)
+                        or (isinstance(item, (int, float)) and buf[end] in _JSON_NUMBER_CHARS)):
+                    chunk = f.read(chunk_size)
+                    if chunk:
+                        buf, pos = buf[pos:] + chunk, 0
+                        continue
+                    if error is not None:
+                        raise ValueError(
+                            f"Malformed JSON array in {filepath}: {error}"
+                        ) from error
+                yield item
+                pos = end
+                state = 'sep'